@@ -1,16 +1,46 @@
+import io
+from pathlib import Path
+
 import streamlit as st
-from PIL import Image
+
+from converter.engine import (
+    CATEGORY_AREA,
+    CATEGORY_BITS_BYTES,
+    CATEGORY_LENGTH,
+    CATEGORY_MASS,
+    CATEGORY_SPEED,
+    CATEGORY_TEMPERATURE,
+    CATEGORY_TIME,
+    CATEGORY_VOLUME,
+    CATEGORY_WEIGHT,
+    conversion_units,
+    convert,
+)
 
 # Set up the page
 st.set_page_config(page_title="Unit Converter", page_icon="📏")
 st.title("🌟 Unit Converter App 🌟")
 
+ICON_PATH = Path(__file__).parent / "unit_converter_icon.jpg"
+ICON_WIDTH = 200
+
+# Decode the icon once per server process and keep a display-sized copy;
+# PIL is only imported on this path
+@st.cache_resource
+def load_icon():
+    from PIL import Image
+
+    with Image.open(ICON_PATH) as image:
+        image.thumbnail((ICON_WIDTH, ICON_WIDTH * image.height // image.width))
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
 # Load and display an icon if available
 try:
-    icon = Image.open("unit_converter_icon.jpg")
-    st.image(icon, width=200)
+    st.image(load_icon(), width=ICON_WIDTH)
 except FileNotFoundError:
-    st.warning("Icon image not found! Make sure 'unit_converter_icon.png' is in the same directory.")
+    st.warning(f"Icon image not found! Make sure '{ICON_PATH.name}' is in the same directory.")
 
 # Define constants to avoid duplication
 VALUE_PROMPT = "Enter value:"
@@ -18,109 +48,34 @@ FROM_PROMPT = "From:"
 TO_PROMPT = "To:"
 CONVERT_BUTTON = "Convert"
 
-# Conversion factors as constants
-CONVERSION_FACTORS = {
-    "Area 🌍": {
-        "Square Meter": 1,
-        "Square Kilometer": 1e6,
-        "Hectare": 1e4,
-        "Acre": 4046.86
-    },
-    "Bits & Bytes 💾": {
-        "Bit": 1,
-        "Byte": 8,
-        "Kilobyte": 8 * 1024,
-        "Megabyte": 8 * 1024**2
-    },
-    "Length 📏": {
-        "Meter": 1,
-        "Kilometer": 1e3,
-        "Mile": 1609.34,
-        "Yard": 0.9144
-    },
-    "Mass ⚖️": {
-        "Gram": 1,
-        "Kilogram": 1e3,
-        "Pound": 453.592,
-        "Ounce": 28.3495
-    },
-    "Speed 🚀": {
-        "Meter/Second": 1,
-        "Kilometer/Hour": 0.277778,
-        "Mile/Hour": 0.44704
-    },
-    "Time ⏰": {
-        "Second": 1,
-        "Minute": 60,
-        "Hour": 3600,
-        "Day": 86400
-    },
-    "Volume 🥤": {
-        "Milliliter": 1,
-        "Liter": 1e3,
-        "Gallon": 3785.41,
-        "Cubic Meter": 1e6
-    },
-    "Weight 🏋️": {
-        "Gram": 1,
-        "Kilogram": 1e3,
-        "Pound": 453.592
-    }
+# Sidebar labels mapped onto the shared conversion engine's categories
+CATEGORY_LABELS = {
+    "Area 🌍": CATEGORY_AREA,
+    "Bits & Bytes 💾": CATEGORY_BITS_BYTES,
+    "Length 📏": CATEGORY_LENGTH,
+    "Mass ⚖️": CATEGORY_MASS,
+    "Speed 🚀": CATEGORY_SPEED,
+    "Temperature 🌡️": CATEGORY_TEMPERATURE,
+    "Time ⏰": CATEGORY_TIME,
+    "Volume 🥤": CATEGORY_VOLUME,
+    "Weight 🏋️": CATEGORY_WEIGHT
 }
 
-# Function for temperature conversion
-def convert_temperature(value, unit, target_unit):
-    if unit == target_unit:
-        return value
-    conversions = {
-        ("Celsius", "Fahrenheit"): lambda v: v * 9 / 5 + 32,
-        ("Fahrenheit", "Celsius"): lambda v: (v - 32) * 5 / 9,
-        ("Celsius", "Kelvin"): lambda v: v + 273.15,
-        ("Kelvin", "Celsius"): lambda v: v - 273.15,
-        ("Fahrenheit", "Kelvin"): lambda v: (v - 32) * 5 / 9 + 273.15,
-        ("Kelvin", "Fahrenheit"): lambda v: (v - 273.15) * 9 / 5 + 32
-    }
-    return conversions.get((unit, target_unit), lambda v: v)(value)
-
-# Function to handle standard conversions
-def handle_standard_conversion(value, unit, target_unit, conversions):
-    if unit == target_unit:
-        return value
-    return value * conversions[unit] / conversions[target_unit]
-
 # Main function for unit conversion
 def convert_units(category):
     value = st.number_input(VALUE_PROMPT, min_value=0.0, format="%.2f")
 
-    if category in CONVERSION_FACTORS:
-        conversions = CONVERSION_FACTORS[category]
-        unit_options = list(conversions.keys())
-        unit = st.selectbox(FROM_PROMPT, unit_options)
-        target_unit = st.selectbox(TO_PROMPT, unit_options)
-        if st.button(CONVERT_BUTTON):
-            result = handle_standard_conversion(value, unit, target_unit, conversions)
-            st.success(f"Result: {result:.2f} {target_unit}")
-
-    elif category == "Temperature 🌡️":
-        unit = st.selectbox(FROM_PROMPT, ["Celsius", "Fahrenheit", "Kelvin"])
-        target_unit = st.selectbox(TO_PROMPT, ["Celsius", "Fahrenheit", "Kelvin"])
-        if st.button(CONVERT_BUTTON):
-            result = convert_temperature(value, unit, target_unit)
-            st.success(f"Result: {result:.2f} {target_unit}")
+    category = CATEGORY_LABELS[category]
+    unit_options = conversion_units[category]
+    unit = st.selectbox(FROM_PROMPT, unit_options)
+    target_unit = st.selectbox(TO_PROMPT, unit_options)
+    if st.button(CONVERT_BUTTON):
+        result = convert(category, value, unit, target_unit)
+        st.success(f"Result: {result:.2f} {target_unit}")
 
 # Sidebar for selecting category
 st.sidebar.title("Choose a Category")
-category = st.sidebar.selectbox("Category", [
-    "Area 🌍",
-    "Bits & Bytes 💾",
-    "Length 📏",
-    "Mass ⚖️",
-    "Speed 🚀",
-    "Temperature 🌡️",
-    "Time ⏰",
-    "Volume 🥤",
-    "Weight 🏋️"
-])
+category = st.sidebar.selectbox("Category", list(CATEGORY_LABELS))
 
 # Perform unit conversion based on selected category
 convert_units(category)
@@ -0,0 +1,50 @@
+"""Compare convert-then-summarize with aggregate-first statistics.
+
+The data is processed in chunks as a streaming export would be, and summary
+statistics are wanted in two target units. Run from the repository root:
+
+    python -m benchmarks.bench_aggregate
+"""
+
+import timeit
+
+import numpy as np
+
+from converter.aggregate import StreamingStats
+from converter.batch import convert_array
+from converter.engine import CATEGORY_TEMPERATURE
+
+N = 20_000_000
+CHUNK = 1_000_000
+SOURCE = "Fahrenheit"
+TARGETS = ("Celsius", "Kelvin")
+
+
+def main():
+    data = np.random.default_rng(0).normal(60, 20, N)
+    chunks = [data[start:start + CHUNK] for start in range(0, N, CHUNK)]
+
+    def convert_first():
+        stats = {unit: StreamingStats(CATEGORY_TEMPERATURE, unit) for unit in TARGETS}
+        for chunk in chunks:
+            for unit in TARGETS:
+                stats[unit].update(convert_array(CATEGORY_TEMPERATURE, chunk, SOURCE, unit))
+        return {unit: accumulator.summary() for unit, accumulator in stats.items()}
+
+    def aggregate_first():
+        stats = StreamingStats(CATEGORY_TEMPERATURE, SOURCE)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats.summaries(TARGETS)
+
+    expected, actual = convert_first(), aggregate_first()
+    for unit in TARGETS:
+        error = abs(actual[unit].mean - expected[unit].mean) / abs(expected[unit].mean)
+        print(f"{unit}: mean {actual[unit].mean:.9f} (relative difference {error:.1e})")
+    for name, fn in [("convert, then summarize", convert_first), ("aggregate first", aggregate_first)]:
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:24s} {seconds * 1e3:8.1f} ms  {N / seconds / 1e6:8.1f} M values/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare converting into every unit one target at a time with the fan-out.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_fanout
+"""
+
+import timeit
+
+import numpy as np
+
+from converter.batch import convert_array, convert_to_all
+from converter.engine import CATEGORY_BITS_BYTES, CATEGORY_TEMPERATURE, conversion_units, convert
+
+N = 1_000_000
+
+
+def main():
+    values = np.random.default_rng(0).uniform(0, 1000, N)
+    for category in (CATEGORY_BITS_BYTES, CATEGORY_TEMPERATURE):
+        units = conversion_units[category]
+        source = units[1]
+        cases = [
+            ("scalar, convert() per unit", 10_000,
+             lambda: [convert(category, 42.0, source, unit) for unit in units]),
+            ("scalar, fan-out", 10_000, lambda: convert_to_all(category, 42.0, source)),
+            (f"{N} values, convert_array() per unit", 1,
+             lambda: np.stack([convert_array(category, values, source, unit) for unit in units], axis=-1)),
+            (f"{N} values, fan-out", 1, lambda: convert_to_all(category, values, source)),
+        ]
+        print(f"{category} ({len(units)} units)")
+        for name, number, fn in cases:
+            seconds = min(timeit.repeat(fn, number=number, repeat=3)) / number
+            print(f"  {name:42s} {seconds * 1e6:12.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
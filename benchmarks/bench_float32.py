@@ -0,0 +1,49 @@
+"""Compare the float64 and float32 batch paths, and their sampled error.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_float32
+"""
+
+import timeit
+
+import numpy as np
+
+from converter.batch import FLOAT32_TOLERANCE, convert_array, convert_array32, float32_error
+
+N = 20_000_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    data64 = rng.uniform(0, 1000, N)
+    data32 = data64.astype(np.float32)
+    out64 = np.empty_like(data64)
+    out32 = np.empty_like(data32)
+
+    cases = [
+        ("float64 convert_array", lambda: convert_array("Length", data64, "Mile", "Kilometer", out=out64)),
+        ("float32 convert_array32", lambda: convert_array32("Length", data32, "Mile", "Kilometer", out=out32)),
+    ]
+    for name, fn in cases:
+        seconds = min(timeit.repeat(fn, number=1, repeat=5))
+        print(f"{name:24s} {seconds * 1e3:8.1f} ms  {N / seconds / 1e6:8.1f} M values/s")
+    print(f"array memory: float64 {data64.nbytes / 2**20:.0f} MiB, float32 {data32.nbytes / 2**20:.0f} MiB")
+
+    samples = [
+        ("Length", data64, "Mile", "Kilometer"),
+        ("Bits & Bytes", data64, "Petabyte", "Bit"),
+        ("Bits & Bytes", data64 * 1e12, "Bit", "Petabyte"),
+        ("Temperature", data64, "Celsius", "Fahrenheit"),
+        ("Temperature", 250 + data64 / 10, "Kelvin", "Celsius"),
+        ("Temperature", 273.15 + (data64 - 500) / 5e4, "Kelvin", "Celsius"),
+    ]
+    print(f"max relative error on a sample (tolerance {FLOAT32_TOLERANCE:g})")
+    for category, values, from_unit, to_unit in samples:
+        error = float32_error(category, values, from_unit, to_unit)
+        print(f"  {from_unit:>10s} -> {to_unit:<10s} {error:10.2e}"
+              f"  {'ok' if error <= FLOAT32_TOLERANCE else 'refused/warned'}")
+
+
+if __name__ == "__main__":
+    main()
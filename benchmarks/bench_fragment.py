@@ -0,0 +1,58 @@
+"""Elements and bytes sent per keystroke: full rerun vs. converter fragment.
+
+A full rerun re-sends every element on the page; a fragment rerun only
+re-sends the elements inside the fragment. This sums the serialized size of
+the element protos in each case from an AppTest render. Run from the
+repository root:
+
+    python -m benchmarks.bench_fragment [app.py]
+"""
+
+import sys
+
+from streamlit.testing.v1 import AppTest
+
+
+def elements(node):
+    children = getattr(node, "children", None)
+    if children:
+        for child in children.values():
+            yield from elements(child)
+    elif getattr(node, "proto", None) is not None:
+        yield node
+
+
+def fragment_block(node):
+    # The innermost block wrapping both unit selectboxes and the result
+    children = getattr(node, "children", None) or {}
+    for child in children.values():
+        found = fragment_block(child)
+        if found is not None:
+            return found
+    keys = {getattr(element, "key", None) for element in elements(node)}
+    if children and {"from_unit", "to_unit", "input_value"} <= keys and node.type == "vertical":
+        return node
+    return None
+
+
+def summarize(name, nodes):
+    nodes = list(nodes)
+    size = sum(node.proto.ByteSize() for node in nodes)
+    print(f"{name:16s} {len(nodes):3d} elements  {size:6d} bytes")
+    return size
+
+
+def main():
+    script = sys.argv[1] if len(sys.argv) > 1 else "app.py"
+    at = AppTest.from_file(script, default_timeout=60).run()
+    full = summarize("full rerun", elements(at._tree))
+    block = fragment_block(at.main)
+    if block is None:
+        print("no converter fragment found")
+        return
+    panel = summarize("fragment rerun", elements(block))
+    print(f"reduction        {100 * (1 - panel / full):.0f}% of element bytes per input change")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare column-by-column DataFrame conversion with the one-block pass.
+
+Measured on a long frame (few columns, many rows) and a wide one (hundreds
+of columns), where per-column Python overhead dominates. Run from the
+repository root:
+
+    python -m benchmarks.bench_frames
+"""
+
+import itertools
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from converter.batch import convert_array
+from converter.engine import category_for
+from converter.frames import convert_frame
+
+UNITS = (
+    ("mi", "km"), ("ft", "m"), ("°F", "C"), ("MB", "Mbit"),
+    ("min", "h"), ("mph", "km/h"), ("lb", "kg"), ("gal", "L"),
+)
+SHAPES = ((1_000_000, 8), (20_000, 400))
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for rows, width in SHAPES:
+        schema = {f"c{index}": units for index, units in zip(range(width), itertools.cycle(UNITS))}
+        frame = pd.DataFrame(rng.uniform(0, 1000, (rows, width)), columns=list(schema))
+        frame["id"] = np.arange(rows)
+
+        def per_column():
+            result = frame.copy()
+            for column, (from_unit, to_unit) in schema.items():
+                category = category_for(from_unit, to_unit)
+                result[column] = convert_array(category, result[column].to_numpy(), from_unit, to_unit)
+            return result
+
+        working = frame.copy()
+        print(f"{rows} rows x {width} columns")
+        for name, fn in [
+            ("column by column", per_column),
+            ("one block, copy", lambda: convert_frame(frame, schema)),
+            ("one block, inplace", lambda: convert_frame(working, schema, inplace=True)),
+        ]:
+            seconds = min(timeit.repeat(fn, number=1, repeat=5))
+            print(f"  {name:20s} {seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
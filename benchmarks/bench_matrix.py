@@ -0,0 +1,59 @@
+"""Compare the dict-and-divide conversion path with the factor matrix.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_matrix
+"""
+
+import random
+import timeit
+
+import numpy as np
+
+from converter.batch import convert_ids, convert_pairs
+from converter.engine import CATEGORY_LENGTH, CONVERSION_TO_BASE, conversion_units, unit_id
+
+N = 1_000_000
+
+
+def handle_standard_conversion(value, unit, target_unit, conversions):
+    # The per-call path the front-ends used before the engine existed
+    if unit == target_unit:
+        return value
+    return value * conversions[unit] / conversions[target_unit]
+
+
+def main():
+    rng = random.Random(0)
+    units = conversion_units[CATEGORY_LENGTH]
+    factors = CONVERSION_TO_BASE[CATEGORY_LENGTH]
+    values = [rng.uniform(0, 1000) for _ in range(N)]
+    pairs = [(rng.choice(units), rng.choice(units)) for _ in range(N)]
+    id_pairs = [(unit_id(CATEGORY_LENGTH, f), unit_id(CATEGORY_LENGTH, t)) for f, t in pairs]
+
+    def dict_divide():
+        for value, (f, t) in zip(values, pairs):
+            handle_standard_conversion(value, f, t, factors)
+
+    def matrix_scalar():
+        for value, (f, t) in zip(values, id_pairs):
+            convert_ids(CATEGORY_LENGTH, value, f, t)
+
+    array = np.array(values)
+    from_ids = np.array([f for f, _ in id_pairs])
+    to_ids = np.array([t for _, t in id_pairs])
+
+    def matrix_fancy():
+        convert_pairs(CATEGORY_LENGTH, array, from_ids, to_ids)
+
+    for name, fn in [
+        ("dict-and-divide (python loop)", dict_divide),
+        ("matrix index (python loop)", matrix_scalar),
+        ("matrix fancy indexing (vectorized)", matrix_fancy),
+    ]:
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:38s} {seconds * 1e3:9.1f} ms  {N / seconds / 1e6:8.1f} M conv/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare a row-wise ``apply`` with factorized mixed-unit conversion.
+
+The apply baseline is timed on a slice and extrapolated. Run from the
+repository root:
+
+    python -m benchmarks.bench_mixed [rows]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from converter.engine import CATEGORY_LENGTH, conversion_units, convert
+from converter.frames import convert_mixed
+
+APPLY_ROWS = 200_000
+
+
+def main(rows=10_000_000):
+    rng = np.random.default_rng(0)
+    units = np.array(conversion_units[CATEGORY_LENGTH], dtype=object)
+    frame = pd.DataFrame({
+        "value": rng.uniform(0, 1000, rows),
+        "unit": units[rng.integers(0, len(units), rows)],
+    })
+    head = frame.head(APPLY_ROWS)
+
+    def row_apply():
+        head.apply(lambda row: convert(CATEGORY_LENGTH, row["value"], row["unit"], "Kilometer"), axis=1)
+
+    categorical = frame["unit"].astype("category")
+    cases = [
+        ("row-wise apply (extrapolated)", row_apply, rows / APPLY_ROWS),
+        ("factorized, object labels", lambda: convert_mixed(CATEGORY_LENGTH, frame["value"], frame["unit"], "km"), 1),
+        ("factorized, categorical labels", lambda: convert_mixed(CATEGORY_LENGTH, frame["value"], categorical, "km"), 1),
+    ]
+    for name, fn, scale in cases:
+        seconds = min(timeit.repeat(fn, number=1, repeat=3)) * scale
+        print(f"{name:32s} {seconds:9.3f} s  {rows / seconds / 1e6:8.2f} M rows/s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,56 @@
+"""Compare eager per-hop conversions with lazy QuantityArray chains.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_quantity
+"""
+
+import timeit
+
+import numpy as np
+
+from converter.batch import convert_array
+from converter.engine import CATEGORY_LENGTH, CATEGORY_TEMPERATURE
+from converter.quantity import QuantityArray
+
+N = 10_000_000
+CHAINS = (
+    (CATEGORY_LENGTH, ("Kilometer", "Meter", "Foot", "Mile")),
+    (CATEGORY_TEMPERATURE, ("Fahrenheit", "Celsius", "Kelvin", "Rankine")),
+)
+
+
+def main():
+    rng = np.random.default_rng(0)
+    values = rng.uniform(0, 1000, N)
+    other = rng.uniform(0, 1000, N)
+    for category, chain in CHAINS:
+        def eager():
+            result = values
+            for from_unit, to_unit in zip(chain, chain[1:]):
+                result = convert_array(category, result, from_unit, to_unit)
+            return result
+
+        def lazy():
+            quantity = QuantityArray(values, category, chain[0])
+            for unit in chain[1:]:
+                quantity = quantity.to(unit)
+            return quantity.values
+
+        def eager_add():
+            return convert_array(category, values, chain[0], chain[1]) + \
+                convert_array(category, other, chain[-1], chain[1])
+
+        def lazy_add():
+            return (QuantityArray(values, category, chain[0]).to(chain[1])
+                    + QuantityArray(other, category, chain[-1])).values
+
+        print(f"{category}: {' -> '.join(chain)} ({N} values)")
+        for name, fn in [("eager chain", eager), ("lazy chain", lazy),
+                         ("eager align + add", eager_add), ("lazy align + add", lazy_add)]:
+            seconds = min(timeit.repeat(fn, number=1, repeat=3))
+            print(f"  {name:20s} {seconds * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
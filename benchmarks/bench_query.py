@@ -0,0 +1,62 @@
+"""Throughput of the free-text query parser, with and without its cache.
+
+The corpus mimics interactive use: a few dozen query shapes with a
+Zipf-like popularity, most typed with a handful of common values. Run from
+the repository root:
+
+    python -m benchmarks.bench_query
+"""
+
+import random
+import timeit
+
+from converter import query
+
+N = 200_000
+
+TEMPLATES = (
+    "{} mi to km", "{} km to mi", "{} °F in C", "{}°C to F", "{} kg to lb",
+    "{} lbs in kg", "{} ft to m", "{} in to cm", "{} cm in inches", "{} mph to km/h",
+    "{} kph to mph", "{} GB to MB", "{} MiB to MB", "{} Mbit to MB", "{} gal to L",
+    "{} cups to ml", "{} tbsp to tsp", "{} oz in g", "{} acres to hectares", "{} sq ft to m2",
+    "{} hours in minutes", "{} days to weeks", "{} K to °C", "{} knots to m/s", "{} stone in kg",
+    "{} kilometres per hour in mph", "{} fl oz to ml", "{} TB to GiB", "{} years in days", "{} m to yd",
+)
+COMMON_VALUES = ("1", "2", "5", "10", "100", "3.5", "72", "0.5", "1,000", "1e3")
+
+
+def corpus(n, rng):
+    weights = [1 / rank for rank in range(1, len(TEMPLATES) + 1)]
+    queries = []
+    for template in rng.choices(TEMPLATES, weights, k=n):
+        if rng.random() < 0.9:
+            value = rng.choice(COMMON_VALUES)
+        else:
+            value = f"{rng.uniform(0, 1000):.2f}"
+        queries.append(template.format(value))
+    return queries
+
+
+def main():
+    queries = corpus(N, random.Random(0))
+    print(f"{N} queries, {len(set(queries))} distinct")
+
+    def uncached():
+        for text in queries:
+            query._parse_query(text)
+
+    def cached():
+        query.parse_query.cache_clear()
+        for text in queries:
+            query.run_query(text)
+
+    for name, fn in [("parse, no cache", uncached), ("parse + convert, LRU cache", cached)]:
+        seconds = min(timeit.repeat(fn, number=1, repeat=3))
+        print(f"{name:28s} {seconds * 1e3:9.1f} ms  {N / seconds / 1e3:8.1f} k queries/s")
+    stats = query.cache_stats()
+    print(f"cache: {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hits'] / (stats['hits'] + stats['misses']):.1%} hit rate)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Server-side rerun latency of a Streamlit front-end.
+
+Drives the script with Streamlit's AppTest harness, so it measures script
+execution and element serialisation without a browser. Run from the
+repository root:
+
+    python -m benchmarks.bench_rerun [app.py] [reruns]
+"""
+
+import statistics
+import sys
+import time
+
+from streamlit.testing.v1 import AppTest
+
+
+def main():
+    script = sys.argv[1] if len(sys.argv) > 1 else "app.py"
+    reruns = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    at = AppTest.from_file(script, default_timeout=60)
+    start = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - start
+
+    timings = []
+    for i in range(reruns):
+        at.number_input(key="input_value").set_value(float(i + 2))
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+
+    print(f"{script}: first run {first * 1e3:.1f} ms, "
+          f"rerun median {statistics.median(timings) * 1e3:.2f} ms, "
+          f"p90 {statistics.quantiles(timings, n=10)[-1] * 1e3:.2f} ms over {reruns} reruns")
+
+
+if __name__ == "__main__":
+    main()
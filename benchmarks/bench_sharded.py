@@ -0,0 +1,54 @@
+"""Scaling of the sharded CSV converter from 1 to N worker processes.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_sharded [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from converter.sharded import convert_csv_sharded
+
+
+def write_sample(path, rows):
+    rng = np.random.default_rng(0)
+    with open(path, "w") as f:
+        f.write("sensor,timestamp,distance_mi\n")
+        for start in range(0, rows, 1_000_000):
+            n = min(1_000_000, rows - start)
+            ids = rng.integers(0, 1000, n)
+            values = rng.uniform(0, 500, n)
+            f.writelines(f"s{i},{start + k},{v:.6f}\n" for k, (i, v) in enumerate(zip(ids, values)))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 4_000_000
+    cores = os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "in.csv")
+        dst = os.path.join(tmp, "out.csv")
+        write_sample(src, rows)
+        size_mb = os.path.getsize(src) / 1e6
+        print(f"{rows:,} rows, {size_mb:.0f} MB, {cores} cores")
+        baseline = None
+        workers = 1
+        while True:
+            start = time.perf_counter()
+            convert_csv_sharded(src, dst, "distance_mi", "Length", "Mile", "Kilometer",
+                                workers=workers, shard_bytes=16 * 1024 * 1024)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"workers={workers:3d}  {elapsed:7.2f} s  {rows / elapsed:12,.0f} rows/s  "
+                  f"speedup x{baseline / elapsed:.2f}")
+            if workers >= cores:
+                break
+            workers = min(workers * 2, cores)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Cold-start cost of each Streamlit front-end.
+
+Every app is measured in a fresh interpreter: the time to import Streamlit
+itself, then the first render of the script (which includes whatever the
+script imports on top of Streamlit). Heavy third-party modules that the
+first render pulled in are listed. Run from the repository root:
+
+    python -m benchmarks.bench_startup [app.py app5.py ...]
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+APPS = ("app.py", "app5.py", "app7.py")
+HEAVY_MODULES = ("pandas", "numpy", "PIL", "plotly", "requests", "pyperclip")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+before = set(sys.modules)
+at = AppTest.from_file(sys.argv[1], default_timeout=120)
+at.run()
+rendered = time.perf_counter()
+heavy = sorted({name.split(".")[0] for name in set(sys.modules) - before} & set(sys.argv[2:]))
+print(json.dumps({"import": imported - start, "render": rendered - imported, "heavy": heavy}))
+"""
+
+
+def measure(app):
+    env = dict(os.environ, PYTHONPATH=os.getcwd())
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, app, *HEAVY_MODULES],
+        check=True, capture_output=True, text=True, env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    apps = sys.argv[1:] or APPS
+    for app in apps:
+        runs = [measure(app) for _ in range(3)]
+        best = min(runs, key=lambda run: run["render"])
+        print(f"{app:10s} streamlit import {min(r['import'] for r in runs) * 1e3:7.0f} ms  "
+              f"first render {best['render'] * 1e3:7.0f} ms  "
+              f"heavy imports: {', '.join(best['heavy']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
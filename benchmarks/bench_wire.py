@@ -0,0 +1,84 @@
+"""Throughput of the binary framed protocol against the JSON batch endpoint.
+
+Both servers run in background threads of this process. Run from the
+repository root:
+
+    python -m benchmarks.bench_wire [values]
+"""
+
+import asyncio
+import http.client
+import json
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
+
+from converter.service import ConversionServer
+from converter.wire import ConversionClient, serve
+
+HTTP_PORT = 18000
+WIRE_PORT = 18001
+
+
+def start_in_thread(coroutine):
+    threading.Thread(target=asyncio.run, args=(coroutine,), daemon=True).start()
+
+
+def wait_for_port(port):
+    for _ in range(100):
+        try:
+            socket.create_connection(("127.0.0.1", port)).close()
+            return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+def best_of(fn, repeat=3):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = np.random.default_rng(0).uniform(0, 1000, n)
+
+    start_in_thread(ConversionServer(workers=2).serve("127.0.0.1", HTTP_PORT))
+    start_in_thread(serve("127.0.0.1", WIRE_PORT))
+    wait_for_port(HTTP_PORT)
+    wait_for_port(WIRE_PORT)
+
+    http_conn = http.client.HTTPConnection("127.0.0.1", HTTP_PORT)
+
+    def via_json():
+        body = json.dumps({"category": "Length", "from": "Mile", "to": "Kilometer",
+                           "values": values.tolist()})
+        http_conn.request("POST", "/convert/batch", body, {"Content-Type": "application/json"})
+        np.array(json.loads(http_conn.getresponse().read())["values"])
+
+    with ConversionClient(("127.0.0.1", WIRE_PORT)) as client:
+        def via_wire(dtype):
+            array = values.astype(dtype)
+            return lambda: client.convert("Length", array, "Mile", "Kilometer")
+
+        expected = values * 1.60934
+        np.testing.assert_allclose(client.convert("Length", values, "Mile", "Kilometer"), expected)
+
+        for name, fn in [
+            ("JSON /convert/batch", via_json),
+            ("framed float64", via_wire(np.float64)),
+            ("framed float32", via_wire(np.float32)),
+        ]:
+            seconds = best_of(fn)
+            print(f"{name:22s} {seconds * 1e3:9.1f} ms  {n / seconds / 1e6:8.2f} M values/s")
+
+
+if __name__ == "__main__":
+    main()
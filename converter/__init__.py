@@ -0,0 +1,37 @@
+"""Streamlit-free unit conversion core shared by the app front-ends."""
+
+from converter.engine import (
+    CATEGORY_AREA,
+    CATEGORY_BITS_BYTES,
+    CATEGORY_LENGTH,
+    CATEGORY_MASS,
+    CATEGORY_SPEED,
+    CATEGORY_TEMPERATURE,
+    CATEGORY_TIME,
+    CATEGORY_VOLUME,
+    CATEGORY_WEIGHT,
+    category_for,
+    conversion_functions,
+    conversion_plan,
+    conversion_units,
+    convert,
+    unit_id,
+)
+
+__all__ = [
+    "CATEGORY_AREA",
+    "CATEGORY_BITS_BYTES",
+    "CATEGORY_LENGTH",
+    "CATEGORY_MASS",
+    "CATEGORY_SPEED",
+    "CATEGORY_TEMPERATURE",
+    "CATEGORY_TIME",
+    "CATEGORY_VOLUME",
+    "CATEGORY_WEIGHT",
+    "category_for",
+    "conversion_functions",
+    "conversion_plan",
+    "conversion_units",
+    "convert",
+    "unit_id",
+]
@@ -0,0 +1,4 @@
+from converter.cli import main
+import sys
+
+sys.exit(main())
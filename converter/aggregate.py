@@ -0,0 +1,121 @@
+"""Streaming summary statistics, converted after aggregation.
+
+Every unit conversion is affine with a positive scale, ``y = x * s + o``, so
+statistics gathered in the source unit map onto any target unit without
+revisiting the data:
+
+    count      unchanged
+    min, max   x * s + o
+    mean       mean * s + o
+    sum        sum * s + count * o
+    variance   variance * s ** 2  (std * s)
+    histogram  edges * s + o, same counts
+
+Chunks are folded in with Chan et al.'s parallel mean/variance update, so
+memory stays O(1) whatever the input size, and partial results (from shards)
+can be merged.
+"""
+
+import math
+from typing import NamedTuple
+
+import numpy as np
+
+from converter.engine import conversion_plan, conversion_units, unit_id
+
+
+class Summary(NamedTuple):
+    unit: str
+    count: int
+    sum: float
+    mean: float
+    variance: float  # population variance (ddof=0)
+    std: float
+    min: float
+    max: float
+    histogram: tuple  # (edges, counts) arrays, or None
+
+
+class StreamingStats:
+    """Accumulate count, sum, mean, variance, min, max and an optional histogram.
+
+    Values are taken in ``unit``; NaNs are skipped. ``bins`` gives histogram
+    edges in that unit (values outside them are not counted).
+    """
+
+    def __init__(self, category, unit, bins=None):
+        self.category = category
+        self.unit = conversion_units[category][unit_id(category, unit)]
+        self.count = 0
+        self.total = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.edges = None if bins is None else np.asarray(bins, dtype=np.float64)
+        self.counts = None if bins is None else np.zeros(len(self.edges) - 1, dtype=np.int64)
+
+    def update(self, values):
+        """Fold one chunk of values into the running statistics."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        missing = np.isnan(values)
+        if missing.any():
+            values = values[~missing]
+        n = values.size
+        if not n:
+            return
+        chunk_sum = float(values.sum())
+        chunk_mean = chunk_sum / n
+        deviations = values - chunk_mean
+        chunk_m2 = float(np.dot(deviations, deviations))
+        self._merge(n, chunk_sum, chunk_mean, chunk_m2, float(values.min()), float(values.max()))
+        if self.counts is not None:
+            self.counts += np.histogram(values, self.edges)[0]
+
+    def merge(self, other):
+        """Fold in another accumulator over the same category, unit and bins."""
+        if (other.category, other.unit) != (self.category, self.unit):
+            raise ValueError(f"Cannot merge statistics in {other.unit!r} into {self.unit!r}")
+        if other.counts is not None or self.counts is not None:
+            if other.edges is None or self.edges is None or not np.array_equal(other.edges, self.edges):
+                raise ValueError("Cannot merge statistics with different histogram bins")
+            self.counts += other.counts
+        if other.count:
+            self._merge(other.count, other.total, other.mean, other.m2, other.min, other.max)
+
+    def _merge(self, n, total, mean, m2, low, high):
+        count = self.count + n
+        delta = mean - self.mean
+        self.mean += delta * n / count
+        self.m2 += m2 + delta * delta * self.count * n / count
+        self.count = count
+        self.total += total
+        self.min = min(self.min, low)
+        self.max = max(self.max, high)
+
+    def summary(self, to_unit=None):
+        """The statistics expressed in ``to_unit`` (default: the source unit)."""
+        to_unit = to_unit or self.unit
+        scale, offset = conversion_plan(self.category, self.unit, to_unit)
+        to_unit = conversion_units[self.category][unit_id(self.category, to_unit)]
+        histogram = None
+        if self.edges is not None:
+            histogram = (self.edges * scale + offset, self.counts.copy())
+        if not self.count:
+            return Summary(to_unit, 0, 0.0, math.nan, math.nan, math.nan, math.nan, math.nan, histogram)
+        variance = self.m2 / self.count * scale * scale
+        return Summary(
+            unit=to_unit,
+            count=self.count,
+            sum=self.total * scale + self.count * offset,
+            mean=self.mean * scale + offset,
+            variance=variance,
+            std=math.sqrt(variance),
+            min=self.min * scale + offset,
+            max=self.max * scale + offset,
+            histogram=histogram,
+        )
+
+    def summaries(self, to_units):
+        """:meth:`summary` for several target units at once, keyed by unit."""
+        return {unit: self.summary(unit) for unit in to_units}
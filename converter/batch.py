@@ -0,0 +1,215 @@
+"""Vectorized NumPy conversions over the engine's unit tables.
+
+Every unit is affine against its category's base unit, so each category
+compiles to a pair of N x N matrices indexed by integer unit IDs: the scale
+and the offset that map unit ``i`` onto unit ``j``. Linear categories simply
+have an all-zero offset matrix, which the conversion routines skip.
+
+A float32 path halves memory and bandwidth for bulk work. Its precision is
+checked against float64 on a sample of the input before it is trusted.
+"""
+
+import warnings
+
+import numpy as np
+
+from converter.engine import REGISTRY, conversion_plan, conversion_units, unit_id
+
+
+def _compile_matrices():
+    # Zero-copy views over the registry's compiled pair tables
+    scales = {}
+    offsets = {}
+    for category, units in conversion_units.items():
+        shape = (len(units), len(units))
+        scale_table, offset_table = REGISTRY.pair_tables(category)
+        scales[category] = np.frombuffer(scale_table, dtype=np.float64).reshape(shape)
+        offsets[category] = np.frombuffer(offset_table, dtype=np.float64).reshape(shape)
+        scales[category].setflags(write=False)
+        offsets[category].setflags(write=False)
+    return scales, offsets
+
+
+# FACTOR_MATRICES[category][i, j] and OFFSET_MATRICES[category][i, j] map unit
+# ID i onto unit ID j as value * factor + offset
+FACTOR_MATRICES, OFFSET_MATRICES = _compile_matrices()
+
+# Categories whose conversions need the offset term (Temperature)
+AFFINE_CATEGORIES = frozenset(
+    category for category, offset in OFFSET_MATRICES.items() if offset.any()
+)
+
+# Largest relative error the float32 path may show on its sample: about six
+# significant digits, as many as the front-ends display
+FLOAT32_TOLERANCE = 5e-7
+
+# Elements checked against float64 by the float32 path
+FLOAT32_SAMPLE = 10_000
+
+
+class PrecisionWarning(UserWarning):
+    """A float32 conversion lost more precision than its tolerance allows."""
+
+
+class PrecisionError(ValueError):
+    """A float32 conversion was refused for losing too much precision."""
+
+
+# Nested-list copies for scalar lookups, where NumPy indexing overhead dominates
+_AFFINE_ROWS = {
+    category: [list(zip(*rows)) for rows in zip(FACTOR_MATRICES[category].tolist(),
+                                                 OFFSET_MATRICES[category].tolist())]
+    for category in FACTOR_MATRICES
+}
+
+
+def factor_matrix(category):
+    """Return the read-only N x N from -> to factor matrix for ``category``."""
+    try:
+        return FACTOR_MATRICES[category]
+    except KeyError:
+        raise ValueError(f"Unknown category {category!r}") from None
+
+
+def offset_matrix(category):
+    """Return the read-only N x N from -> to offset matrix for ``category``."""
+    try:
+        return OFFSET_MATRICES[category]
+    except KeyError:
+        raise ValueError(f"Unknown category {category!r}") from None
+
+
+def convert_array(category, values, from_unit, to_unit, out=None):
+    """Convert an array-like of values in one vectorized multiply-add.
+
+    ``values`` may be any array-like; the result is a float64 array. Pass
+    ``out`` (which may be ``values`` itself) to write the result in place.
+    """
+    scale, offset = conversion_plan(category, from_unit, to_unit)
+    values = np.asarray(values, dtype=np.float64)
+    out = np.multiply(values, scale, out=out)
+    if offset:
+        np.add(out, offset, out=out)
+    return out
+
+
+def convert_ids(category, value, from_id, to_id):
+    """Convert a scalar using integer unit IDs: one index plus one multiply-add."""
+    try:
+        rows = _AFFINE_ROWS[category]
+    except KeyError:
+        raise ValueError(f"Unknown category {category!r}") from None
+    # Checked explicitly: a negative ID would silently index from the end
+    if not (0 <= from_id < len(rows) and 0 <= to_id < len(rows)):
+        raise ValueError(f"Unit IDs ({from_id}, {to_id}) out of range for category {category!r}")
+    scale, offset = rows[from_id][to_id]
+    return value * scale + offset
+
+
+def convert_pairs(category, values, from_ids, to_ids, out=None):
+    """Convert values whose from/to unit IDs vary per element.
+
+    ``from_ids`` and ``to_ids`` are integer arrays broadcastable against
+    ``values``; the per-element scale and offset are gathered with fancy
+    indexing.
+    """
+    matrix = factor_matrix(category)
+    from_ids = np.asarray(from_ids)
+    to_ids = np.asarray(to_ids)
+    for ids in (from_ids, to_ids):
+        if ids.size and (ids.min() < 0 or ids.max() >= len(matrix)):
+            raise ValueError(f"Unit IDs out of range for category {category!r}")
+    factors = matrix[from_ids, to_ids]
+    out = np.multiply(np.asarray(values, dtype=np.float64), factors, out=out)
+    if category in AFFINE_CATEGORIES:
+        np.add(out, OFFSET_MATRICES[category][from_ids, to_ids], out=out)
+    return out
+
+
+def convert_to_all(category, values, from_unit, out=None):
+    """Convert values into every unit of ``category`` in one broadcast pass.
+
+    The from-unit's row of the factor matrix (and of the offset matrix, for
+    affine categories) is broadcast against ``values``, giving an array of
+    shape ``values.shape + (units,)``: a vector for a scalar, a values x
+    units matrix for a 1-D array. Columns follow ``conversion_units[category]``.
+    """
+    from_id = unit_id(category, from_unit)
+    values = np.asarray(values, dtype=np.float64)
+    out = np.multiply(values[..., np.newaxis], FACTOR_MATRICES[category][from_id], out=out)
+    if category in AFFINE_CATEGORIES:
+        np.add(out, OFFSET_MATRICES[category][from_id], out=out)
+    return out
+
+
+def float32_error(category, values, from_unit, to_unit, sample=FLOAT32_SAMPLE, compute32=True):
+    """Largest relative error of the float32 path against float64.
+
+    Measured on ``sample`` evenly spaced elements of ``values``, including
+    the rounding of the input itself to float32. Results that overflow, or
+    that cancel to (near) zero where float64 does not, show up as large or
+    infinite errors. With ``compute32=False`` only the result is rounded to
+    float32, as when float64 input is converted into float32 output.
+    """
+    scale, offset = conversion_plan(category, from_unit, to_unit)
+    flat = np.asarray(values).reshape(-1)
+    if not flat.size:
+        return 0.0
+    picked = flat[np.linspace(0, flat.size - 1, min(flat.size, sample)).astype(np.intp)]
+    with np.errstate(all="ignore"):
+        exact = picked.astype(np.float64) * scale + offset
+        if compute32:
+            compact = picked.astype(np.float32) * np.float32(scale) + np.float32(offset)
+        else:
+            compact = exact.astype(np.float32)
+        error = np.abs(compact.astype(np.float64) - exact) / np.abs(exact)
+    # Exact zeros on both sides, and matching infinities or NaNs, are no error
+    error[(compact == exact) | (np.isnan(exact) & np.isnan(compact))] = 0.0
+    return float(np.nan_to_num(error, nan=np.inf, posinf=np.inf).max())
+
+
+def check_float32(category, values, from_unit, to_unit, on_loss="warn",
+                  tolerance=FLOAT32_TOLERANCE, sample=FLOAT32_SAMPLE, compute32=True):
+    """Measure :func:`float32_error` and apply the ``on_loss`` policy to it.
+
+    Above ``tolerance``, ``"warn"`` issues a PrecisionWarning and ``"raise"``
+    raises PrecisionError. Returns the error; ``"ignore"`` skips sampling
+    altogether and returns NaN (not measured).
+    """
+    if on_loss not in ("warn", "raise", "ignore"):
+        raise ValueError(f"on_loss must be 'warn', 'raise' or 'ignore', not {on_loss!r}")
+    if on_loss == "ignore":
+        return float(np.nan)
+    error = float32_error(category, values, from_unit, to_unit, sample, compute32)
+    if error > tolerance:
+        message = (f"float32 conversion from {from_unit!r} to {to_unit!r} has a relative "
+                   f"error of {error:.2g} on its sample (tolerance {tolerance:.2g})")
+        if on_loss == "raise":
+            raise PrecisionError(message)
+        warnings.warn(message, PrecisionWarning, stacklevel=3)
+    return error
+
+
+def convert_array32(category, values, from_unit, to_unit, out=None,
+                    on_loss="warn", tolerance=FLOAT32_TOLERANCE, sample=FLOAT32_SAMPLE):
+    """Convert in float32, half the memory and bandwidth of :func:`convert_array`.
+
+    The precision is checked first with :func:`check_float32`; with
+    ``on_loss="raise"`` nothing is converted if it fails. Returns ``(result,
+    max_relative_error)``, the result being a float32 array: ``out`` if
+    given, which must be float32 and may be ``values`` itself. Otherwise a
+    float32 copy of ``values``, if one has to be made, is converted in place.
+    The error is NaN with ``on_loss="ignore"``, which skips the check.
+    """
+    if out is not None and out.dtype != np.float32:
+        raise ValueError(f"out must be a float32 array, not {out.dtype}")
+    error = check_float32(category, values, from_unit, to_unit, on_loss, tolerance, sample)
+    scale, offset = conversion_plan(category, from_unit, to_unit)
+    array = np.asarray(values, dtype=np.float32)
+    if out is None and array is not values and array.base is None:
+        # A fresh copy, shared with no caller: reuse it for the result
+        out = array
+    out = np.multiply(array, np.float32(scale), out=out)
+    if offset:
+        np.add(out, np.float32(offset), out=out)
+    return out, error
@@ -0,0 +1,113 @@
+"""Memory-mapped conversion of numeric binary arrays.
+
+Handles ``.npy`` files and raw little-endian float dumps. Input and output
+are mapped with ``numpy.memmap`` and converted block by block, so neither
+file is ever loaded whole into RAM and no text parsing takes place.
+"""
+
+import os
+
+import numpy as np
+
+from converter.aggregate import StreamingStats
+from converter.batch import check_float32
+from converter.engine import conversion_plan
+
+# Elements converted per block; bounds the dirty pages held at any moment
+DEFAULT_BLOCK = 1 << 20
+
+RAW_DTYPES = {"float64": "<f8", "float32": "<f4"}
+
+
+def is_npy(path):
+    return os.path.splitext(path)[1].lower() == ".npy"
+
+
+def open_array(path, raw_dtype=None, mode="r"):
+    """Memory-map a ``.npy`` file or a raw dump of ``raw_dtype`` values."""
+    if is_npy(path):
+        array = np.load(path, mmap_mode=mode)
+    else:
+        if raw_dtype is None:
+            raise ValueError(f"{path!r} is not a .npy file; a raw dtype is required")
+        array = np.memmap(path, dtype=RAW_DTYPES.get(raw_dtype, raw_dtype), mode=mode)
+    if array.dtype.kind != "f":
+        raise ValueError(f"{path!r} holds {array.dtype}, expected a floating-point array")
+    return array
+
+
+def create_like(path, array, dtype=None):
+    """Create a writable memory-mapped output matching ``array``'s layout.
+
+    ``dtype`` overrides the element type, e.g. to write float32 output.
+    """
+    dtype = array.dtype if dtype is None else np.dtype(RAW_DTYPES.get(dtype, dtype))
+    if is_npy(path):
+        return np.lib.format.open_memmap(
+            path, mode="w+", dtype=dtype, shape=array.shape,
+            fortran_order=array.flags.f_contiguous and not array.flags.c_contiguous,
+        )
+    return np.memmap(path, dtype=dtype, mode="w+", shape=array.shape)
+
+
+def convert_blocks(src, dst, scale, offset, block=DEFAULT_BLOCK):
+    """Apply ``value * scale + offset`` from ``src`` into ``dst`` block by block.
+
+    The arithmetic runs in the wider of the two element types; a narrower
+    ``dst`` only rounds each finished value once, on store.
+    """
+    flat_src = src.ravel(order="K")
+    flat_dst = dst.ravel(order="K")
+    dtype = np.result_type(flat_src.dtype, flat_dst.dtype)
+    # Narrowing output: compute in a reusable scratch block, never in dst, so
+    # the offset of an affine conversion is not added to already rounded values
+    scratch = None if dtype == flat_dst.dtype else np.empty(min(block, flat_src.size), dtype)
+    for start in range(0, flat_src.size, block):
+        out = flat_dst[start:start + block]
+        work = out if scratch is None else scratch[:out.size]
+        np.multiply(flat_src[start:start + block], scale, out=work, dtype=dtype)
+        if offset:
+            np.add(work, offset, out=work)
+        if scratch is not None:
+            out[...] = work
+
+
+def convert_file(src, dst, category, from_unit, to_unit, raw_dtype=None, block=DEFAULT_BLOCK,
+                 dtype=None, on_loss="warn"):
+    """Convert a binary array file into ``dst``, or in place when ``dst`` is None.
+
+    ``dtype`` sets the output element type (default: the input's). Whenever
+    the output is float32, its precision is first checked on a sample of the
+    input and ``on_loss`` applied (see ``batch.check_float32``).
+
+    Returns the number of converted elements.
+    """
+    scale, offset = conversion_plan(category, from_unit, to_unit)
+    if dst is None or os.path.abspath(dst) == os.path.abspath(src):
+        array = open_array(src, raw_dtype, mode="r+")
+        if dtype is not None and np.dtype(RAW_DTYPES.get(dtype, dtype)) != array.dtype:
+            raise ValueError("an in-place conversion cannot change the element type")
+        if array.dtype == np.float32:
+            check_float32(category, array, from_unit, to_unit, on_loss)
+        convert_blocks(array, array, scale, offset, block)
+        array.flush()
+        return array.size
+
+    array = open_array(src, raw_dtype)
+    out = create_like(dst, array, dtype)
+    if out.dtype == np.float32:
+        # convert_blocks computes a float64 input in float64 and rounds on store
+        check_float32(category, array, from_unit, to_unit, on_loss,
+                      compute32=array.dtype == np.float32)
+    convert_blocks(array, out, scale, offset, block)
+    out.flush()
+    return array.size
+
+
+def summarize_file(src, category, unit, raw_dtype=None, block=DEFAULT_BLOCK, bins=None):
+    """Stream a binary array file into a :class:`StreamingStats` in ``unit``."""
+    flat = open_array(src, raw_dtype).ravel(order="K")
+    stats = StreamingStats(category, unit, bins)
+    for start in range(0, flat.size, block):
+        stats.update(flat[start:start + block])
+    return stats
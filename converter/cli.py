@@ -0,0 +1,134 @@
+"""Command-line bulk converter.
+
+    python -m converter readings.csv converted.csv --column distance --from Mile --to Kilometer
+    python -m converter archive.npy --in-place --from Kelvin --to Celsius
+    python -m converter readings.csv --stats --column distance --from Mile --to Kilometer --to Foot
+"""
+
+import argparse
+import sys
+import time
+
+from converter.binary import RAW_DTYPES, convert_file, is_npy, summarize_file
+from converter.engine import category_for, conversion_units
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m converter",
+        description="Convert one column of a CSV/TSV file, or a numeric binary array, between units.",
+    )
+    parser.add_argument("input", help="source CSV/TSV, .npy or raw float file")
+    parser.add_argument("output", nargs="?", help="destination file")
+    parser.add_argument("--column", help="column name or zero-based index (text files)")
+    parser.add_argument("--from", dest="from_unit", required=True, help="source unit")
+    parser.add_argument("--to", dest="to_units", action="append", required=True,
+                        help="target unit (repeatable with --stats)")
+    parser.add_argument("--category", choices=list(conversion_units),
+                        help="unit category (inferred from the units when omitted)")
+    parser.add_argument("--output-column", help="write results to this column instead of overwriting")
+    parser.add_argument("--sep", help="field separator (default: from the file extension)")
+    parser.add_argument("--chunksize", type=int,
+                        help="rows per chunk (default: 100000)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="convert line-aligned shards in this many processes (default: 1)")
+    parser.add_argument("--raw-dtype", choices=list(RAW_DTYPES),
+                        help="treat the input as raw little-endian floats of this type")
+    parser.add_argument("--float32", action="store_true",
+                        help="write float32 output from a binary input (half the size)")
+    parser.add_argument("--on-loss", choices=("warn", "raise", "ignore"), default="warn",
+                        help="when float32 output loses precision (default: warn)")
+    parser.add_argument("--in-place", action="store_true",
+                        help="overwrite a binary input instead of writing OUTPUT")
+    parser.add_argument("--stats", action="store_true",
+                        help="print summary statistics in --from and every --to unit instead of converting")
+    return parser
+
+
+def run_binary(args, category):
+    if args.output is None and not args.in_place:
+        raise ValueError("an OUTPUT file or --in-place is required")
+    count = convert_file(args.input, None if args.in_place else args.output,
+                         category, args.from_unit, args.to_unit, raw_dtype=args.raw_dtype,
+                         dtype="float32" if args.float32 else None, on_loss=args.on_loss)
+    return count, 0
+
+
+def run_text(args, category):
+    if args.output is None or args.column is None:
+        raise ValueError("text conversion requires an OUTPUT file and --column")
+    if args.float32:
+        raise ValueError("--float32 applies to binary inputs only")
+    # pandas is only needed for text files, so it is imported on this path alone
+    if args.workers > 1:
+        from converter.sharded import convert_csv_sharded
+
+        return convert_csv_sharded(
+            args.input, args.output, args.column, category, args.from_unit, args.to_unit,
+            sep=args.sep, workers=args.workers, output_column=args.output_column,
+        )
+    from converter.streaming import DEFAULT_CHUNKSIZE, convert_csv
+
+    return convert_csv(
+        args.input, args.output, args.column, category, args.from_unit, args.to_unit,
+        sep=args.sep, chunksize=args.chunksize or DEFAULT_CHUNKSIZE,
+        output_column=args.output_column,
+    )
+
+
+def run_stats(args, category, binary):
+    # Aggregated in the source unit in one pass, then mapped onto each target
+    if binary:
+        stats, invalid = summarize_file(args.input, category, args.from_unit, raw_dtype=args.raw_dtype), 0
+    else:
+        if args.column is None:
+            raise ValueError("text statistics require --column")
+        from converter.streaming import DEFAULT_CHUNKSIZE, summarize_csv
+
+        stats, invalid = summarize_csv(args.input, args.column, category, args.from_unit, sep=args.sep,
+                                       chunksize=args.chunksize or DEFAULT_CHUNKSIZE)
+    header = ("unit", "count", "mean", "std", "min", "max", "sum")
+    print("\t".join(header))
+    for summary in stats.summaries([args.from_unit, *args.to_units]).values():
+        print(f"{summary.unit}\t{summary.count}\t{summary.mean:.10g}\t{summary.std:.10g}\t"
+              f"{summary.min:.10g}\t{summary.max:.10g}\t{summary.sum:.10g}")
+    return stats.count, invalid
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if len(args.to_units) > 1 and not args.stats:
+        print("error: several --to units are only supported with --stats", file=sys.stderr)
+        return 2
+    args.to_unit = args.to_units[0]
+    category = args.category or category_for(args.from_unit, args.to_unit)
+    if category is None:
+        print(f"error: no category defines both {args.from_unit!r} and {args.to_unit!r}",
+              file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    binary = args.raw_dtype is not None or is_npy(args.input)
+    try:
+        if args.stats:
+            rows, invalid = run_stats(args, category, binary)
+        else:
+            rows, invalid = run_binary(args, category) if binary else run_text(args, category)
+    except (ValueError, OSError) as exc:
+        # OSError: missing input, unwritable output and the like
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - start
+
+    unit = "values" if binary else "rows"
+    verb = "Summarized" if args.stats else "Converted"
+    print(f"{verb} {rows:,} {unit} in {elapsed:.2f} s ({rows / max(elapsed, 1e-9):,.0f} {unit}/s)",
+          file=sys.stderr)
+    if invalid:
+        outcome = "skipped" if args.stats else "left empty"
+        print(f"warning: {invalid:,} values could not be parsed and were {outcome}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
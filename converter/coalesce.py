@@ -0,0 +1,87 @@
+"""Micro-batching of concurrent scalar conversions.
+
+Scalar requests that arrive within ``window`` seconds of each other, up to
+``max_batch`` of them, are grouped by ``(category, from, to)`` and converted
+with one vectorized call; each caller then gets its own element back.
+Batch-size and queue-delay histograms are kept for tuning.
+"""
+
+import asyncio
+from bisect import bisect_left
+
+from converter.batch import convert_array
+from converter.engine import conversion_plan
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048, 4096)
+QUEUE_DELAY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+
+class Histogram:
+    """Per-bucket counts over fixed, inclusive upper bounds."""
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        buckets = [{"le": bound, "count": count} for bound, count in zip(self.bounds, self.counts)]
+        buckets.append({"le": "+Inf", "count": self.counts[-1]})
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class Coalescer:
+    def __init__(self, window=0.001, max_batch=1024):
+        self.window = window
+        self.max_batch = max_batch
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_delays = Histogram(QUEUE_DELAY_BUCKETS)
+        self._pending = {}
+        self._timers = {}
+
+    async def convert(self, category, value, from_unit, to_unit):
+        """Convert one value, sharing a vectorized call with concurrent callers."""
+        # Validate up front so one bad request cannot fail a whole batch
+        conversion_plan(category, from_unit, to_unit)
+        value = float(value)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        key = (category, from_unit, to_unit)
+        group = self._pending.setdefault(key, [])
+        group.append((value, future, loop.time()))
+        if len(group) >= self.max_batch:
+            self._flush(key)
+        elif len(group) == 1:
+            self._timers[key] = loop.call_later(self.window, self._flush, key)
+        return await future
+
+    def _flush(self, key):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        group = self._pending.pop(key, None)
+        if not group:
+            return
+
+        now = asyncio.get_running_loop().time()
+        results = convert_array(key[0], [value for value, _, _ in group], key[1], key[2]).tolist()
+        self.batch_sizes.observe(len(group))
+        for (_, future, enqueued), result in zip(group, results):
+            self.queue_delays.observe(now - enqueued)
+            if not future.done():
+                future.set_result(result)
+
+    def metrics(self):
+        return {
+            "window": self.window,
+            "max_batch": self.max_batch,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_delay_seconds": self.queue_delays.snapshot(),
+        }
@@ -0,0 +1,150 @@
+"""Dimensional analysis for compound and powered units.
+
+Every linear unit is a scale against SI-style base units plus an integer
+exponent vector over length, mass, time and information, taken from its
+category: a Foot is ``0.3048 * L``, a Square Foot ``0.09290304 * L^2``, a
+Knot ``463/900 * L T^-1``. Unit expressions combine any units and aliases
+with ``*``, ``/``, ``per`` and integer powers (``^2``, ``**3``, ``²``), so
+``"GB/hour"``, ``"Mbit/s"``, ``"kg*m/s^2"`` or ``"ft^3/min"`` need no table
+entries of their own.
+
+Scales are composed in exact rational arithmetic and rounded once. Parsed
+units and from -> to factors are memoized, so after the first use a
+conversion costs a cache hit and one multiply.
+"""
+
+import re
+from fractions import Fraction
+from functools import lru_cache
+from typing import NamedTuple
+
+from converter.engine import (
+    CATEGORY_AREA,
+    CATEGORY_BITS_BYTES,
+    CATEGORY_LENGTH,
+    CATEGORY_MASS,
+    CATEGORY_SPEED,
+    CATEGORY_TIME,
+    CATEGORY_VOLUME,
+    CATEGORY_WEIGHT,
+    REGISTRY,
+)
+from converter.lookup import default_index
+
+DIMENSIONS = ("L", "M", "T", "I")  # length, mass, time, information
+
+# Exponent vector of each category's units. Temperature is affine (its units
+# carry offsets), so it cannot take part in products and is left out
+CATEGORY_DIMENSIONS = {
+    CATEGORY_LENGTH: (1, 0, 0, 0),
+    CATEGORY_AREA: (2, 0, 0, 0),
+    CATEGORY_VOLUME: (3, 0, 0, 0),
+    CATEGORY_MASS: (0, 1, 0, 0),
+    CATEGORY_WEIGHT: (0, 1, 0, 0),
+    CATEGORY_TIME: (0, 0, 1, 0),
+    CATEGORY_SPEED: (1, 0, -1, 0),
+    CATEGORY_BITS_BYTES: (0, 0, 0, 1),
+}
+
+DIMENSIONLESS = (0, 0, 0, 0)
+
+_OPERATOR = re.compile(r"\s*([*/·×]|\bper\b)\s*", re.IGNORECASE)
+_POWER = re.compile(r"^(?P<base>.+?)\s*(?:\^\s*(?P<exponent>[-+]?\d+)|(?P<superscript>[²³]))$")
+_TRAILING_POWER = re.compile(r"^(?P<base>[^\W\d]+)(?P<exponent>[23])$")
+_SUPERSCRIPTS = {"²": 2, "³": 3}
+
+
+class Unit(NamedTuple):
+    scale: Fraction
+    dimensions: tuple
+
+    def __mul__(self, other):
+        return Unit(self.scale * other.scale,
+                    tuple(a + b for a, b in zip(self.dimensions, other.dimensions)))
+
+    def __truediv__(self, other):
+        return Unit(self.scale / other.scale,
+                    tuple(a - b for a, b in zip(self.dimensions, other.dimensions)))
+
+    def __pow__(self, exponent):
+        return Unit(self.scale ** exponent, tuple(a * exponent for a in self.dimensions))
+
+
+def format_dimensions(dimensions):
+    """Render an exponent vector, e.g. ``"L·T^-1"``; ``"1"`` if dimensionless."""
+    parts = [symbol if power == 1 else f"{symbol}^{power}"
+             for symbol, power in zip(DIMENSIONS, dimensions) if power]
+    return "·".join(parts) or "1"
+
+
+def _named_unit(text):
+    # The unit a single name or alias refers to, or None if it is unknown
+    index = default_index()
+    unit_ids = index.lookup(text)
+    candidates = set()
+    for unit_id in unit_ids:
+        dimensions = CATEGORY_DIMENSIONS.get(index.category_of(unit_id))
+        if dimensions is not None:
+            candidates.add(Unit(REGISTRY.exact_scales[unit_id], dimensions))
+    if unit_ids and not candidates:
+        raise ValueError(f"Unit {text!r} has an offset and cannot be combined")
+    if len(candidates) > 1:
+        raise ValueError(f"Ambiguous unit {text!r}")
+    return candidates.pop() if candidates else None
+
+
+def _factor(text):
+    if text == "1":
+        return Unit(Fraction(1), DIMENSIONLESS)
+    unit = _named_unit(text)
+    if unit is not None:
+        return unit
+    match = _POWER.match(text) or _TRAILING_POWER.match(text)
+    if match is not None:
+        base = _named_unit(match["base"])
+        if base is not None:
+            superscript = match.groupdict().get("superscript")
+            return base ** (_SUPERSCRIPTS[superscript] if superscript else int(match["exponent"]))
+    raise ValueError(f"Unknown unit {text!r}")
+
+
+@lru_cache(maxsize=1024)
+def parse_unit(expression):
+    """Parse a unit expression such as ``"GB/hour"`` into a :class:`Unit`."""
+    expression = expression.strip()
+    if not expression:
+        raise ValueError("Empty unit expression")
+    # Whole names first, so aliases like "km/h" or "Mile per Hour" win
+    unit = _named_unit(expression)
+    if unit is not None:
+        return unit
+    tokens = _OPERATOR.split(expression.replace("**", "^"))
+    unit = _factor(tokens[0])
+    for operator, text in zip(tokens[1::2], tokens[2::2]):
+        factor = _factor(text)
+        unit = unit * factor if operator in "*·×" else unit / factor
+    return unit
+
+
+@lru_cache(maxsize=4096)
+def conversion_factor(from_expression, to_expression):
+    """Factor mapping values in ``from_expression`` onto ``to_expression``.
+
+    Raises ``ValueError`` for unknown units, mismatched dimensions or a
+    factor too large for a float.
+    """
+    source, target = parse_unit(from_expression), parse_unit(to_expression)
+    if source.dimensions != target.dimensions:
+        raise ValueError(
+            f"Cannot convert {from_expression!r} ({format_dimensions(source.dimensions)}) "
+            f"to {to_expression!r} ({format_dimensions(target.dimensions)})"
+        )
+    try:
+        return float(source.scale / target.scale)
+    except OverflowError:
+        raise ValueError(f"Converting {from_expression!r} to {to_expression!r} overflows a float") from None
+
+
+def convert_compound(value, from_expression, to_expression):
+    """Convert ``value`` between two unit expressions."""
+    return value * conversion_factor(from_expression, to_expression)
@@ -0,0 +1,132 @@
+"""Unit tables and the scalar conversion entry point.
+
+The tables come from the compiled unit registry (see ``converter.registry``
+and ``units.json``), loaded once at import time. A conversion is a single
+dict lookup for the precompiled ``(scale, offset)`` of a ``(category, from,
+to)`` triple followed by one multiply-add.
+"""
+
+from functools import partial
+
+from converter.registry import load_registry
+
+# Define category name constants to avoid string duplication
+CATEGORY_LENGTH = "Length"
+CATEGORY_AREA = "Area"
+CATEGORY_VOLUME = "Volume"
+CATEGORY_MASS = "Mass"
+CATEGORY_TEMPERATURE = "Temperature"
+CATEGORY_TIME = "Time"
+CATEGORY_SPEED = "Speed"
+CATEGORY_BITS_BYTES = "Bits & Bytes"
+CATEGORY_WEIGHT = "Weight"
+
+REGISTRY = load_registry()
+
+# Category order shown by the front-ends
+CATEGORY_ORDER = list(REGISTRY.categories)
+
+# Integer category IDs, in CATEGORY_ORDER
+CATEGORY_IDS = {category: category_id for category_id, category in enumerate(CATEGORY_ORDER)}
+
+# Every unit as (scale, offset) against its category's base unit
+UNITS_TO_BASE = {
+    category: {
+        REGISTRY.names[i]: (REGISTRY.scales[i], REGISTRY.offsets[i])
+        for i in REGISTRY.unit_range(category)
+    }
+    for category in CATEGORY_ORDER
+}
+
+# Factor that converts one unit of each linear category into its base unit
+CONVERSION_TO_BASE = {
+    category: {unit: scale for unit, (scale, _) in units.items()}
+    for category, units in UNITS_TO_BASE.items()
+    if not any(offset for _, offset in units.values())
+}
+
+# Define conversion units for each category
+conversion_units = {category: list(units) for category, units in UNITS_TO_BASE.items()}
+
+# Integer unit IDs per category, in conversion_units order
+UNIT_IDS = {
+    category: {unit: unit_id for unit_id, unit in enumerate(units)}
+    for category, units in conversion_units.items()
+}
+
+
+def _compile_pairs():
+    pairs = {}
+    for category, units in conversion_units.items():
+        scales, offsets = REGISTRY.pair_tables(category)
+        cells = iter(zip(scales, offsets))
+        for from_unit in units:
+            for to_unit in units:
+                pairs[category, from_unit, to_unit] = next(cells)
+    return pairs
+
+
+_PAIRS = _compile_pairs()
+
+
+def _find_unit(category, unit):
+    # Canonical name of a unit name or alias within category, or None
+    units = UNIT_IDS.get(category)
+    if units is None:
+        return None
+    if unit in units:
+        return unit
+    # Imported lazily: the alias index is built on first use, off the hot path
+    from converter.lookup import default_index
+
+    matches = {REGISTRY.names[i] for i in default_index().lookup(unit, category)}
+    return matches.pop() if len(matches) == 1 else None
+
+
+def canonical_unit(category, unit):
+    """Return the canonical name of ``unit`` (a name or alias) in ``category``."""
+    name = _find_unit(category, unit)
+    if name is None:
+        raise ValueError(f"Unknown unit {unit!r} in category {category!r}")
+    return name
+
+
+def conversion_plan(category, from_unit, to_unit):
+    """Return the ``(scale, offset)`` that maps ``from_unit`` onto ``to_unit``."""
+    try:
+        return _PAIRS[category, from_unit, to_unit]
+    except KeyError:
+        pass
+    # Slow path: accept aliases such as "km/h" for "Kilometer per Hour"
+    key = (category, _find_unit(category, from_unit), _find_unit(category, to_unit))
+    if key in _PAIRS:
+        return _PAIRS[key]
+    raise ValueError(f"Cannot convert {from_unit!r} to {to_unit!r} in category {category!r}")
+
+
+def convert(category, value, from_unit, to_unit):
+    """Convert ``value`` from ``from_unit`` to ``to_unit`` within ``category``."""
+    scale, offset = conversion_plan(category, from_unit, to_unit)
+    return value * scale + offset
+
+
+def unit_id(category, unit):
+    """Return the integer ID of ``unit`` within ``category``."""
+    units = UNIT_IDS.get(category, {})
+    if unit in units:
+        return units[unit]
+    return units[canonical_unit(category, unit)]
+
+
+def category_for(from_unit, to_unit):
+    """Return the first category that defines both units, or ``None``."""
+    for category in CATEGORY_ORDER:
+        if _find_unit(category, from_unit) and _find_unit(category, to_unit):
+            return category
+    return None
+
+
+# Map categories to conversion functions
+conversion_functions = {
+    category: partial(convert, category) for category in UNITS_TO_BASE
+}
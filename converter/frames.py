@@ -0,0 +1,132 @@
+"""Vectorized unit conversion of pandas DataFrames.
+
+A schema maps each column to ``(from_unit, to_unit)``, or to ``(category,
+from_unit, to_unit)`` where the units alone don't pin the category down.
+Every column's conversion plan is gathered into one scale and one offset
+vector, and the selected columns are converted together as a single float64
+block: one broadcast multiply, plus one add if any column is affine. No
+Python-level work is done per row.
+
+Long-format data, a value column next to a unit column that varies per row,
+is converted by factorizing the unit labels: only the distinct labels are
+resolved, and per-row scales and offsets are gathered by integer code.
+"""
+
+import numpy as np
+import pandas as pd
+
+from converter.batch import AFFINE_CATEGORIES, OFFSET_MATRICES, factor_matrix
+from converter.engine import REGISTRY, category_for, conversion_plan, unit_id
+
+
+class UnknownUnitsError(ValueError):
+    """Raised with every unrecognized unit label at once.
+
+    ``units`` maps each bad label (``None`` for missing ones) to the number
+    of rows that carry it.
+    """
+
+    def __init__(self, category, units):
+        self.category = category
+        self.units = units
+        labels = ", ".join(f"{label!r} ({rows} rows)" for label, rows in units.items())
+        super().__init__(f"Unknown units in category {category!r}: {labels}")
+
+
+def schema_plans(schema):
+    """Return ``(columns, scales, offsets)`` for a column -> units schema."""
+    columns = list(schema)
+    scales = np.empty(len(columns))
+    offsets = np.empty(len(columns))
+    for index, column in enumerate(columns):
+        spec = schema[column]
+        if len(spec) == 3:
+            category, from_unit, to_unit = spec
+        else:
+            from_unit, to_unit = spec
+            category = category_for(from_unit, to_unit)
+            if category is None:
+                raise ValueError(f"Cannot convert {from_unit!r} to {to_unit!r} (column {column!r})")
+        scales[index], offsets[index] = conversion_plan(category, from_unit, to_unit)
+    return columns, scales, offsets
+
+
+def convert_frame(frame, schema, inplace=False):
+    """Convert the columns named in ``schema`` in one vectorized pass.
+
+    Converted columns become float64; other columns are left untouched. With
+    ``inplace=True`` the converted columns are swapped into ``frame`` itself,
+    otherwise a new frame is built around them and copies of the other
+    columns, so the converted columns are never copied twice. Returns the
+    converted frame either way.
+    """
+    if not frame.columns.is_unique:
+        raise ValueError("DataFrame column labels must be unique")
+    columns, scales, offsets = schema_plans(schema)
+    # Column-major (columns x rows), matching how pandas stores numeric blocks,
+    # so each converted row is handed back as a contiguous column
+    block = np.multiply(frame[columns].to_numpy(dtype=np.float64).T, scales[:, np.newaxis])
+    if offsets.any():
+        np.add(block, offsets[:, np.newaxis], out=block)
+
+    if inplace:
+        for position, values in zip(frame.columns.get_indexer(columns), block):
+            frame.isetitem(position, values)
+        return frame
+    converted = dict(zip(columns, block))
+    data = {column: converted[column] if column in converted else series.copy()
+            for column, series in frame.items()}
+    result = pd.DataFrame(data, index=frame.index, columns=frame.columns, copy=False)
+    result.attrs = dict(frame.attrs)
+    return result
+
+
+def convert_mixed(category, values, units, to_unit=None, errors="raise"):
+    """Convert values whose unit label varies per row into ``to_unit``.
+
+    ``units`` holds one label per value (names or aliases; a Categorical is
+    factorized for free). ``to_unit`` defaults to the category's base unit.
+    Unknown or missing labels raise one :class:`UnknownUnitsError` listing
+    them all, or become NaN with ``errors="coerce"``. Returns a float64
+    array shaped like ``values``.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError(f"errors must be 'raise' or 'coerce', not {errors!r}")
+    factors = factor_matrix(category)
+    if to_unit is None:
+        to_unit = REGISTRY.bases[REGISTRY.category_ids[category]]
+    to_id = unit_id(category, to_unit)
+
+    # pandas and NumPy containers go in as they are (a Categorical keeps its
+    # codes); anything else, such as a list, is factorized as an object array
+    if not isinstance(units, (pd.Series, pd.Index, pd.api.extensions.ExtensionArray, np.ndarray)):
+        units = np.asarray(units, dtype=object)
+    codes, labels = pd.factorize(units)
+    # One slot per distinct label plus a trailing NaN slot, which code -1
+    # (a missing label) indexes
+    scales = np.full(len(labels) + 1, np.nan)
+    offsets = np.zeros(len(labels) + 1)
+    unknown = []
+    for code, label in enumerate(labels):
+        try:
+            from_id = unit_id(category, label) if isinstance(label, str) else None
+        except ValueError:
+            from_id = None
+        if from_id is None:
+            unknown.append(code)
+        else:
+            scales[code] = factors[from_id, to_id]
+            offsets[code] = OFFSET_MATRICES[category][from_id, to_id]
+
+    if errors == "raise" and (unknown or (codes < 0).any()):
+        rows = np.bincount(codes + 1, minlength=len(labels) + 1)
+        bad = {labels[code]: int(rows[code + 1]) for code in unknown}
+        if rows[0]:
+            bad[None] = int(rows[0])
+        raise UnknownUnitsError(category, bad)
+
+    out = np.take(scales, codes)
+    np.multiply(out, np.asarray(values, dtype=np.float64), out=out)
+    if category in AFFINE_CATEGORIES:
+        np.add(out, np.take(offsets, codes), out=out)
+    return out
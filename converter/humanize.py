@@ -0,0 +1,73 @@
+"""Pick the most readable unit for a value from its category's ladder.
+
+Each category's ``ladder`` (see ``units.json``) compiles to sorted
+thresholds: the size of every rung in the base unit. A value goes to the
+largest rung it holds at least one of, found by binary search: ``bisect``
+for a scalar, ``numpy.searchsorted`` for whole arrays. Zero, non-finite
+values and categories without a ladder (Temperature, Speed) keep the unit
+they are in.
+"""
+
+import math
+from bisect import bisect_right
+
+from converter.engine import REGISTRY, conversion_units, convert, unit_id
+
+
+def _compile_ladders():
+    ladders = {}
+    for category in REGISTRY.categories:
+        first = REGISTRY.unit_range(category).start
+        rungs = REGISTRY.ladders[REGISTRY.category_ids[category]]
+        if rungs:
+            ladders[category] = ([REGISTRY.scales[i] for i in rungs], [i - first for i in rungs])
+    return ladders
+
+
+# Per category: ascending rung sizes in the base unit, and the rungs' unit IDs
+LADDERS = _compile_ladders()
+
+
+def _scale(category, from_id):
+    return REGISTRY.scales[REGISTRY.unit_range(category)[from_id]]
+
+
+def best_unit(category, value, from_unit):
+    """Return ``(value, unit)`` with ``value`` re-expressed in its most readable unit.
+
+    ``best_unit("Bits & Bytes", 1_530_000, "Byte")`` is ``(1.53, "Megabyte")``.
+    """
+    from_id = unit_id(category, from_unit)
+    from_unit = conversion_units[category][from_id]
+    ladder = LADDERS.get(category)
+    if ladder is None or value == 0 or not math.isfinite(value):
+        return value, from_unit
+    thresholds, ids = ladder
+    rung = max(bisect_right(thresholds, abs(value) * _scale(category, from_id)) - 1, 0)
+    to_unit = conversion_units[category][ids[rung]]
+    return convert(category, value, from_unit, to_unit), to_unit
+
+
+def best_units(category, values, from_unit):
+    """Vectorized :func:`best_unit` over an array of values.
+
+    Returns ``(converted, unit_ids)`` float64 and integer arrays shaped like
+    ``values``; ``unit_ids`` index ``conversion_units[category]``.
+    """
+    # NumPy stays off the import path of the scalar helper above
+    import numpy as np
+
+    from converter.batch import convert_pairs
+
+    from_id = unit_id(category, from_unit)
+    values = np.asarray(values, dtype=np.float64)
+    unit_ids = np.full(values.shape, from_id, dtype=np.intp)
+    ladder = LADDERS.get(category)
+    if ladder is not None:
+        thresholds, ids = ladder
+        magnitude = np.abs(values) * _scale(category, from_id)
+        rungs = np.searchsorted(thresholds, magnitude, side="right") - 1
+        np.maximum(rungs, 0, out=rungs)
+        readable = (magnitude > 0) & np.isfinite(magnitude)
+        unit_ids = np.where(readable, np.asarray(ids, dtype=np.intp)[rungs], from_id)
+    return convert_pairs(category, values, from_id, unit_ids), unit_ids
@@ -0,0 +1,140 @@
+"""Alias index and prefix-trie autocomplete over the unit registry.
+
+Every unit name and alias is indexed twice: verbatim, so case-sensitive
+symbols such as ``"Mb"`` (megabit) and ``"MB"`` (megabyte) stay distinct,
+and in normalized form (casefolded, whitespace collapsed, British spellings
+folded), so ``"Kilometres per hour"`` or ``"KPH"`` still resolve. Both are
+plain dict lookups.
+
+The trie stores, at every node, the best few completions of its subtree,
+precomputed at build time, so a completion costs one step per typed
+character whatever the number of units.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+from converter.engine import REGISTRY
+
+DEFAULT_LIMIT = 10
+
+_SPELLINGS = (("metre", "meter"), ("litre", "liter"), ("gramme", "gram"))
+_SPACES = re.compile(r"\s+")
+_SLASH = re.compile(r"\s*/\s*")
+
+
+def normalize(text):
+    """Fold a unit label to the form used by the normalized index."""
+    text = unicodedata.normalize("NFKC", text).casefold().strip()
+    text = _SLASH.sub("/", _SPACES.sub(" ", text))
+    for british, american in _SPELLINGS:
+        text = text.replace(british, american)
+    return text
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.top = ()
+
+
+class UnitIndex:
+    def __init__(self, registry=REGISTRY, limit=DEFAULT_LIMIT):
+        self.registry = registry
+        self.limit = limit
+        self.exact = {}
+        self.folded = {}
+        self.root = _Node()
+        # Best rank of every unit reachable through each indexed key
+        terminals = {}
+        for alias, unit_ids in registry.aliases.items():
+            key = normalize(alias)
+            self.exact[alias.strip()] = unit_ids
+            merged = self.folded.setdefault(key, ())
+            self.folded[key] = merged + tuple(i for i in unit_ids if i not in merged)
+            for unit_id in unit_ids:
+                # Shorter keys first, canonical names before aliases, then definition order
+                rank = (len(key), alias != registry.names[unit_id], unit_id)
+                best = terminals.setdefault(key, {})
+                best[unit_id] = min(best.get(unit_id, rank), rank)
+
+        for key, ranks in terminals.items():
+            node = self.root
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+            node.top = tuple(sorted((rank, unit_id) for unit_id, rank in ranks.items()))
+        self._collect(self.root)
+
+    def _collect(self, node):
+        # Post-order merge of each subtree's best completions, capped at limit
+        candidates = list(node.top)
+        for child in node.children.values():
+            candidates.extend(self._collect(child))
+        candidates.sort()
+        top, seen = [], set()
+        for rank, unit_id in candidates:
+            if unit_id not in seen:
+                seen.add(unit_id)
+                top.append((rank, unit_id))
+                if len(top) == self.limit:
+                    break
+        node.top = tuple(top)
+        return node.top
+
+    def category_of(self, unit_id):
+        for index, start in enumerate(self.registry.starts[1:]):
+            if unit_id < start:
+                return self.registry.categories[index]
+        raise IndexError(unit_id)
+
+    def lookup(self, text, category=None):
+        """Global unit IDs matching ``text`` exactly, else by normalized form.
+
+        With ``category``, only that category's units are considered, so a
+        verbatim match elsewhere does not hide a normalized one within it.
+        """
+        exact = self.exact.get(text.strip(), ())
+        folded = self.folded.get(normalize(text), ())
+        if category is not None:
+            if category not in self.registry.category_ids:
+                return ()
+            unit_range = self.registry.unit_range(category)
+            exact = tuple(i for i in exact if i in unit_range)
+            folded = tuple(i for i in folded if i in unit_range)
+        return exact or folded
+
+    def resolve(self, text, category=None):
+        """Return ``(category, unit name)`` for ``text``.
+
+        Raises ``ValueError`` when nothing matches, or when the label is
+        ambiguous within ``category`` (or across categories, if none given).
+        """
+        unit_ids = self.lookup(text, category)
+        names = {(self.category_of(i), self.registry.names[i]) for i in unit_ids}
+        if not names:
+            where = f" in category {category!r}" if category else ""
+            raise ValueError(f"Unknown unit {text!r}{where}")
+        if len(names) > 1 and len({name for _, name in names}) > 1:
+            raise ValueError(f"Ambiguous unit {text!r}: {sorted(name for _, name in names)}")
+        # Units shared by several categories (Kilogram in Mass and Weight) resolve
+        # to the first category that defines them
+        return min(names, key=lambda pair: self.registry.category_ids[pair[0]])
+
+    def complete(self, prefix, limit=None):
+        """Up to ``limit`` ``(category, unit name)`` completions of ``prefix``."""
+        node = self.root
+        for char in normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return [(self.category_of(unit_id), self.registry.names[unit_id])
+                for _, unit_id in node.top[:limit or self.limit]]
+
+
+@lru_cache(maxsize=None)
+def default_index():
+    """The process-wide index over the default registry, built on first use."""
+    return UnitIndex()
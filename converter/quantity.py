@@ -0,0 +1,133 @@
+"""Unit-tagged arrays with lazy, fused conversions.
+
+A :class:`QuantityArray` holds raw float64 data plus a pending affine map,
+``values = data * scale + offset``, from the data to its current unit.
+Converting only folds another unit plan into that map, so a chain such as
+km -> m -> ft -> mile allocates nothing; the data is touched once, when the
+values are materialized. While a chain consists of unit changes only, the
+map is taken straight from the exact from -> to tables rather than
+multiplied up hop by hop.
+
+Adding or subtracting arrays of the same category rescales the right-hand
+operand into the left one's unit inside the same pass that combines them.
+"""
+
+import numpy as np
+
+from converter.batch import FACTOR_MATRICES, OFFSET_MATRICES
+from converter.engine import conversion_units, unit_id
+
+
+def _plan(category, from_id, to_id):
+    return float(FACTOR_MATRICES[category][from_id, to_id]), float(OFFSET_MATRICES[category][from_id, to_id])
+
+
+class QuantityArray:
+    """Float64 values of one unit of a category, converted lazily."""
+
+    __array_priority__ = 1000
+
+    def __init__(self, values, category, unit):
+        self.category = category
+        self.unit_id = unit_id(category, unit)
+        self._data = np.asarray(values, dtype=np.float64)
+        # Unit the raw data is in while only unit changes are pending, else None
+        self._data_unit = self.unit_id
+        self._scale = 1.0
+        self._offset = 0.0
+
+    @classmethod
+    def _pending(cls, data, category, to_id, scale, offset, data_unit=None):
+        quantity = cls.__new__(cls)
+        quantity.category = category
+        quantity.unit_id = to_id
+        quantity._data = data
+        quantity._data_unit = data_unit
+        quantity._scale = scale
+        quantity._offset = offset
+        return quantity
+
+    @property
+    def unit(self):
+        return conversion_units[self.category][self.unit_id]
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f"QuantityArray({self.values!r}, {self.category!r}, {self.unit!r})"
+
+    def _composed(self, to_id):
+        # Pending (scale, offset) from the raw data to unit to_id
+        if self._data_unit is not None:
+            return _plan(self.category, self._data_unit, to_id)
+        scale, offset = _plan(self.category, self.unit_id, to_id)
+        return self._scale * scale, self._offset * scale + offset
+
+    def to(self, unit):
+        """Return the same quantity in ``unit``; no data is touched."""
+        to_id = unit_id(self.category, unit)
+        scale, offset = self._composed(to_id)
+        return self._pending(self._data, self.category, to_id, scale, offset, self._data_unit)
+
+    @property
+    def values(self):
+        """The materialized values, computed at most once."""
+        if self._scale != 1.0 or self._offset:
+            data = np.multiply(self._data, self._scale)
+            if self._offset:
+                np.add(data, self._offset, out=data)
+            self._data, self._scale, self._offset = data, 1.0, 0.0
+            self._data_unit = self.unit_id
+        return self._data
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.values
+        if copy:
+            values = values.copy()
+        return values if dtype is None else values.astype(dtype, copy=False)
+
+    def _scaled(self, factor):
+        return self._pending(self._data, self.category, self.unit_id,
+                             self._scale * factor, self._offset * factor)
+
+    def __mul__(self, factor):
+        if isinstance(factor, QuantityArray) or not np.isscalar(factor):
+            return NotImplemented
+        return self._scaled(float(factor))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, factor):
+        if isinstance(factor, QuantityArray) or not np.isscalar(factor):
+            return NotImplemented
+        return self._scaled(1.0 / float(factor))
+
+    def __neg__(self):
+        return self._scaled(-1.0)
+
+    def _combine(self, other, sign, verb):
+        if not isinstance(other, QuantityArray):
+            return NotImplemented
+        if other.category != self.category:
+            raise ValueError(f"Cannot {verb} {other.category!r} and {self.category!r} quantities")
+        # self = a * sa + oa and other, in self's unit, = b * sb + ob, so the
+        # result is (b * (sign * sb / sa) + a) * sa + (oa + sign * ob)
+        scale, offset = self._scale, self._offset
+        other_scale, other_offset = other._composed(self.unit_id)
+        if scale == 0.0:
+            data = np.multiply(other._data, sign * other_scale)
+            return self._pending(data, self.category, self.unit_id, 1.0, offset + sign * other_offset)
+        data = np.multiply(other._data, sign * other_scale / scale)
+        np.add(data, self._data, out=data)
+        return self._pending(data, self.category, self.unit_id, scale, offset + sign * other_offset)
+
+    def __add__(self, other):
+        return self._combine(other, 1.0, "add")
+
+    def __sub__(self, other):
+        return self._combine(other, -1.0, "subtract")
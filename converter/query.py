@@ -0,0 +1,95 @@
+"""Free-text conversion queries such as ``"3.5 mi to km"`` or ``"72 °F in C"``.
+
+A query is ``<number> <unit> <to|in|into|as|->|=> <unit>``. Units are
+resolved through the alias index and the category is inferred as the first
+one that defines both; anything else is tried as a pair of compound unit
+expressions such as ``"10 GB/hour to Mbit/s"`` (see ``converter.dimensions``).
+Parsed queries are immutable and memoized in a bounded LRU cache, since the
+same few queries come up again and again.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+from converter.dimensions import conversion_factor, convert_compound
+from converter.engine import CATEGORY_ORDER, REGISTRY, conversion_functions
+from converter.lookup import default_index
+
+QUERY_CACHE_SIZE = 4096
+
+_QUERY = re.compile(
+    r"""^\s*
+    (?P<value>[-+−]?(?:\d[\d,_]*(?:\.\d*)?|\.\d+)(?:e[-+]?\d+)?)
+    \s*(?P<from_unit>.+?)
+    \s+(?:to|in|into|as|->|→|=)\s+
+    (?P<to_unit>.+?)\s*$""",
+    re.IGNORECASE | re.VERBOSE,
+)
+
+
+class ParsedQuery(NamedTuple):
+    value: float
+    category: str  # None for compound unit expressions
+    from_unit: str
+    to_unit: str
+
+
+def _candidates(text):
+    # {category: {unit names}} for a unit label
+    index = default_index()
+    found = {}
+    for unit_id in index.lookup(text):
+        found.setdefault(index.category_of(unit_id), set()).add(REGISTRY.names[unit_id])
+    if not found:
+        raise ValueError(f"Unknown unit {text!r}")
+    return found
+
+
+def _parse_query(query):
+    match = _QUERY.match(query)
+    if match is None:
+        raise ValueError(f"Expected '<value> <unit> to <unit>', got {query!r}")
+    value = float(match["value"].replace("−", "-").replace(",", "").replace("_", ""))
+    from_text, to_text = match["from_unit"], match["to_unit"]
+    try:
+        return ParsedQuery(value, *_resolve(from_text, to_text))
+    except ValueError as error:
+        # Not a pair of registry units: try them as compound unit expressions
+        try:
+            conversion_factor(from_text, to_text)
+        except ValueError:
+            raise error from None
+        return ParsedQuery(value, None, from_text, to_text)
+
+
+def _resolve(from_text, to_text):
+    # (category, from unit, to unit) for two plain unit labels
+    from_units = _candidates(from_text)
+    to_units = _candidates(to_text)
+    for category in CATEGORY_ORDER:
+        if category in from_units and category in to_units:
+            for label, names in ((from_text, from_units[category]), (to_text, to_units[category])):
+                if len(names) > 1:
+                    raise ValueError(f"Ambiguous unit {label!r}: {sorted(names)}")
+            (from_unit,), (to_unit,) = from_units[category], to_units[category]
+            return category, from_unit, to_unit
+    raise ValueError(f"Cannot convert {from_text!r} to {to_text!r}")
+
+
+parse_query = lru_cache(maxsize=QUERY_CACHE_SIZE)(_parse_query)
+parse_query.__doc__ = "Parse a query into a :class:`ParsedQuery` (memoized)."
+
+
+def run_query(query):
+    """Parse and evaluate ``query``; return ``(ParsedQuery, result)``."""
+    parsed = parse_query(query.strip())
+    if parsed.category is None:
+        return parsed, convert_compound(parsed.value, parsed.from_unit, parsed.to_unit)
+    return parsed, conversion_functions[parsed.category](parsed.value, parsed.from_unit, parsed.to_unit)
+
+
+def cache_stats():
+    """Hit/miss counters of the parsed-query cache."""
+    info = parse_query.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
@@ -0,0 +1,181 @@
+"""Unit registry compiled from the declarative ``units.json``.
+
+The definition file lists every category with its units, their aliases and
+an exact ``scale``/``offset`` against the category's base unit (decimal or
+``"p/q"`` strings), such that ``base = value * scale + offset``. A category
+may also name a ``ladder`` of units to display values in, small to large.
+
+On first load it is compiled into flat ``array`` tables, including the full
+from -> to scale and offset matrix of every category, folded in exact
+rational arithmetic. The compiled tables are pickled next to the package as
+a snapshot keyed by the definition file's hash, so later startups skip
+parsing and compiling entirely.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from array import array
+from fractions import Fraction
+
+DEFINITIONS_PATH = os.path.join(os.path.dirname(__file__), "units.json")
+SNAPSHOT_DIR = os.path.join(os.path.dirname(__file__), "__pycache__")
+
+# Bump whenever the compiled layout changes so stale snapshots are ignored
+SNAPSHOT_FORMAT = 3
+
+
+class Registry:
+    """Array-backed unit tables.
+
+    Units have global integer IDs; the units of category ``c`` occupy the
+    contiguous ID range ``starts[c]:starts[c + 1]`` in definition order.
+    ``ladders[c]`` holds the IDs of the category's display ladder, sorted by
+    ascending scale (empty if it has none). ``exact_scales`` keeps each
+    unit's scale as the exact :class:`~fractions.Fraction` it was defined as.
+    """
+
+    def __init__(self, categories, bases, starts, names, scales, offsets,
+                 pair_scales, pair_offsets, aliases, ladders, exact_scales):
+        self.categories = categories
+        self.bases = bases
+        self.starts = starts
+        self.names = names
+        self.scales = scales
+        self.offsets = offsets
+        self.pair_scales = pair_scales
+        self.pair_offsets = pair_offsets
+        self.aliases = aliases
+        self.ladders = ladders
+        self.exact_scales = exact_scales
+        self.category_ids = {category: index for index, category in enumerate(categories)}
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state["category_ids"]
+        return state
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def unit_range(self, category):
+        index = self.category_ids[category]
+        return range(self.starts[index], self.starts[index + 1])
+
+    def units(self, category):
+        """Unit names of ``category`` in definition order."""
+        unit_range = self.unit_range(category)
+        return self.names[unit_range.start:unit_range.stop]
+
+    def pair_tables(self, category):
+        """Flat row-major N x N from -> to ``(scales, offsets)`` arrays."""
+        index = self.category_ids[category]
+        return self.pair_scales[index], self.pair_offsets[index]
+
+
+def _exact(text):
+    return Fraction(str(text))
+
+
+def compile_definitions(definitions):
+    """Compile parsed ``units.json`` content into a :class:`Registry`."""
+    categories, bases, starts, names = [], [], [0], []
+    scales, offsets = array("d"), array("d")
+    pair_scales, pair_offsets = [], []
+    aliases = {}
+    ladders = []
+    exact_scales = []
+
+    for category in definitions["categories"]:
+        exact = []
+        seen = set()
+        for unit in category["units"]:
+            if unit["name"] in seen:
+                raise ValueError(f"Duplicate unit {unit['name']!r} in {category['name']!r}")
+            seen.add(unit["name"])
+            unit_id = len(names)
+            names.append(unit["name"])
+            scale, offset = _exact(unit["scale"]), _exact(unit.get("offset", 0))
+            if scale <= 0:
+                raise ValueError(f"Unit {unit['name']!r} must have a positive scale")
+            exact.append((scale, offset))
+            exact_scales.append(scale)
+            scales.append(float(scale))
+            offsets.append(float(offset))
+            for alias in (unit["name"], *unit.get("aliases", ())):
+                ids = aliases.setdefault(alias, [])
+                if unit_id not in ids:
+                    ids.append(unit_id)
+        if category["base"] not in seen:
+            raise ValueError(f"Base unit {category['base']!r} is not a unit of {category['name']!r}")
+
+        # Fold "to base" and "from base" into one (scale, offset) per unit pair:
+        # base = v * s1 + o1 and v' = (base - o2) / s2, rounded once to float
+        matrix_scales, matrix_offsets = array("d"), array("d")
+        for s1, o1 in exact:
+            for s2, o2 in exact:
+                matrix_scales.append(float(s1 / s2))
+                matrix_offsets.append(float((o1 - o2) / s2))
+
+        first = starts[-1]
+        ids = {names[i]: i for i in range(first, len(names))}
+        ladder = []
+        for name in category.get("ladder", ()):
+            if name not in ids:
+                raise ValueError(f"Ladder unit {name!r} is not a unit of {category['name']!r}")
+            if exact[ids[name] - first][1]:
+                raise ValueError(f"Ladder unit {name!r} must not have an offset")
+            ladder.append(ids[name])
+        ladders.append(tuple(sorted(ladder, key=lambda i: exact[i - first][0])))
+
+        categories.append(category["name"])
+        bases.append(category["base"])
+        starts.append(len(names))
+        pair_scales.append(matrix_scales)
+        pair_offsets.append(matrix_offsets)
+
+    return Registry(
+        categories=tuple(categories),
+        bases=tuple(bases),
+        starts=array("I", starts),
+        names=tuple(names),
+        scales=scales,
+        offsets=offsets,
+        pair_scales=tuple(pair_scales),
+        pair_offsets=tuple(pair_offsets),
+        aliases={alias: tuple(ids) for alias, ids in aliases.items()},
+        ladders=tuple(ladders),
+        exact_scales=tuple(exact_scales),
+    )
+
+
+def _snapshot_path(source):
+    digest = hashlib.sha256(source).hexdigest()[:16]
+    return os.path.join(SNAPSHOT_DIR, f"units-{SNAPSHOT_FORMAT}-{digest}.pickle")
+
+
+def load_registry(path=DEFINITIONS_PATH, use_snapshot=True):
+    """Load the registry, from its compiled snapshot when one is current."""
+    with open(path, "rb") as f:
+        source = f.read()
+    snapshot = _snapshot_path(source)
+    if use_snapshot:
+        try:
+            with open(snapshot, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+            pass
+
+    registry = compile_definitions(json.loads(source))
+    if use_snapshot:
+        try:
+            os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+            # Write then rename so concurrent processes never read a partial file
+            temporary = f"{snapshot}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as f:
+                pickle.dump(registry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, snapshot)
+        except OSError:
+            pass
+    return registry
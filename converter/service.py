@@ -0,0 +1,242 @@
+"""Small asyncio HTTP/1.1 JSON conversion service.
+
+    python -m converter.service --port 8000 --workers 4
+
+Routes:
+
+* ``GET /health``
+* ``GET /metrics`` with the coalescer's batch-size and queue-delay histograms
+* ``POST /convert`` with ``{"category", "value", "from", "to"}``
+* ``POST /convert/batch`` with either ``{"category", "from", "to", "values": [...]}``
+  or ``{"items": [[value, from, to], ...]}``; ``category`` may be omitted
+  wherever it can be inferred from the units.
+
+Connections are kept alive. Large request bodies are decoded, converted and
+encoded on a thread pool of ``--workers`` threads so the event loop keeps
+serving small requests meanwhile. With ``--coalesce-window`` set, concurrent
+``/convert`` requests are micro-batched by ``converter.coalesce.Coalescer``.
+"""
+
+import argparse
+import asyncio
+import json
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import numpy as np
+
+from converter.batch import convert_array, convert_pairs
+from converter.coalesce import Coalescer
+from converter.engine import category_for, convert, unit_id
+
+# Bodies at least this large are handled off the event loop
+OFFLOAD_BYTES = 64 * 1024
+MAX_BODY_BYTES = 256 * 1024 * 1024
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _encode(result):
+    # NaN and infinities have no JSON spelling
+    try:
+        return json.dumps(result, allow_nan=False).encode()
+    except ValueError:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "Result is not a finite number") from None
+
+
+def _category(payload, from_unit, to_unit):
+    category = payload.get("category") or category_for(from_unit, to_unit)
+    if category is None:
+        raise ValueError(f"No category defines both {from_unit!r} and {to_unit!r}")
+    return category
+
+
+def handle_convert(payload):
+    from_unit, to_unit = payload["from"], payload["to"]
+    category = _category(payload, from_unit, to_unit)
+    return {"category": category, "value": convert(category, float(payload["value"]), from_unit, to_unit)}
+
+
+def _convert_items(payload, items):
+    # Resolve each distinct (from, to) pair once, then convert every category
+    # present with a single gather over its rows
+    values = np.empty(len(items))
+    from_ids = np.empty(len(items), dtype=np.intp)
+    to_ids = np.empty(len(items), dtype=np.intp)
+    categories = np.empty(len(items), dtype=np.intp)
+    resolved = {}
+    names = []
+    for row, (value, from_unit, to_unit) in enumerate(items):
+        key = (from_unit, to_unit)
+        if key not in resolved:
+            category = _category(payload, from_unit, to_unit)
+            # Names or aliases, as /convert and the "values" form accept
+            ids = unit_id(category, from_unit), unit_id(category, to_unit)
+            if category not in names:
+                names.append(category)
+            resolved[key] = (names.index(category), *ids)
+        values[row] = value
+        categories[row], from_ids[row], to_ids[row] = resolved[key]
+
+    if len(names) == 1:
+        return convert_pairs(names[0], values, from_ids, to_ids, out=values)
+    for code, category in enumerate(names):
+        rows = np.flatnonzero(categories == code)
+        values[rows] = convert_pairs(category, values[rows], from_ids[rows], to_ids[rows])
+    return values
+
+
+def handle_batch(payload):
+    if "items" in payload:
+        return {"values": _convert_items(payload, payload["items"]).tolist()}
+    from_unit, to_unit = payload["from"], payload["to"]
+    category = _category(payload, from_unit, to_unit)
+    values = convert_array(category, payload["values"], from_unit, to_unit)
+    return {"category": category, "values": values.tolist()}
+
+
+ROUTES = {
+    ("POST", "/convert"): handle_convert,
+    ("POST", "/convert/batch"): handle_batch,
+}
+
+
+def dispatch(method, path, body):
+    """Run a request to completion and return ``(status, JSON bytes)``."""
+    if path == "/health":
+        if method != "GET":
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use GET")
+        return HTTPStatus.OK, b'{"status": "ok"}'
+    handler = ROUTES.get((method, path))
+    if handler is None:
+        if any(route_path == path for _, route_path in ROUTES):
+            raise RequestError(HTTPStatus.METHOD_NOT_ALLOWED, "Use POST")
+        raise RequestError(HTTPStatus.NOT_FOUND, f"No route for {path}")
+    try:
+        payload = json.loads(body)
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        result = handler(payload)
+    except KeyError as exc:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing field {exc}") from None
+    except (TypeError, ValueError, OverflowError) as exc:
+        # OverflowError: a JSON integer too large for a float64
+        raise RequestError(HTTPStatus.BAD_REQUEST, str(exc)) from None
+    return HTTPStatus.OK, _encode(result)
+
+
+class ConversionServer:
+    def __init__(self, workers=4, coalesce_window=0.0, max_batch=1024):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="convert")
+        self.coalescer = Coalescer(coalesce_window, max_batch) if coalesce_window > 0 else None
+
+    async def convert_coalesced(self, body):
+        try:
+            payload = json.loads(body)
+            from_unit, to_unit = payload["from"], payload["to"]
+            category = _category(payload, from_unit, to_unit)
+            value = await self.coalescer.convert(category, payload["value"], from_unit, to_unit)
+        except KeyError as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f"Missing field {exc}") from None
+        except (TypeError, ValueError, AttributeError, OverflowError) as exc:
+            raise RequestError(HTTPStatus.BAD_REQUEST, str(exc)) from None
+        return HTTPStatus.OK, _encode({"category": category, "value": value})
+
+    def metrics(self):
+        if self.coalescer is None:
+            return HTTPStatus.OK, b'{"coalescing": false}'
+        return HTTPStatus.OK, json.dumps({"coalescing": True, **self.coalescer.metrics()}).encode()
+
+    async def respond(self, method, path, body):
+        try:
+            if method == "GET" and path == "/metrics":
+                return self.metrics()
+            if self.coalescer is not None and method == "POST" and path == "/convert":
+                return await self.convert_coalesced(body)
+            if len(body) >= OFFLOAD_BYTES:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, dispatch, method, path, body)
+            return dispatch(method, path, body)
+        except RequestError as exc:
+            return exc.status, json.dumps({"error": str(exc)}).encode()
+        except Exception:
+            # A bug, not a bad request: log it and answer rather than drop the connection
+            traceback.print_exc()
+            return HTTPStatus.INTERNAL_SERVER_ERROR, b'{"error": "Internal server error"}'
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    status, body = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, b'{"error": "Body too large"}'
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, body = await self.respond(method, target.split("?", 1)[0], body)
+                    connection = headers.get("connection", "").lower()
+                    keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m converter.service", description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=4,
+                        help="threads used for large batch requests (default: 4)")
+    parser.add_argument("--coalesce-window", type=float, default=0.0, metavar="MS",
+                        help="micro-batch concurrent /convert requests within this many ms (default: off)")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="flush a micro-batch early once it holds this many requests (default: 1024)")
+    args = parser.parse_args(argv)
+    server = ConversionServer(workers=args.workers, coalesce_window=args.coalesce_window / 1000,
+                              max_batch=args.max_batch)
+    print(f"Serving conversions on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
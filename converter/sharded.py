@@ -0,0 +1,91 @@
+"""Multi-process conversion of large CSV/TSV files.
+
+The input is split into byte-range shards aligned on line boundaries. Each
+shard is parsed, converted and formatted by a worker process into its own
+part file, and the parts are concatenated in their original order. Shards
+are bounded in size, so memory stays flat per worker.
+
+Line-aligned splitting assumes no quoted field contains a newline.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from converter.streaming import check_distinct, convert_chunk, infer_separator, resolve_column
+
+DEFAULT_SHARD_BYTES = 64 * 1024 * 1024
+
+
+def shard_boundaries(path, shard_bytes=DEFAULT_SHARD_BYTES):
+    """Return the header line and ``(start, end)`` byte ranges of the body.
+
+    Every range starts at the beginning of a line and ends just after a
+    newline (or at end of file).
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        header = f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + shard_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return header, ranges
+
+
+def _convert_shard(task):
+    (src, start, end, header, index, part, sep,
+     column, category, from_unit, to_unit, output_column) = task
+    with open(src, "rb") as f:
+        f.seek(start)
+        body = f.read(end - start)
+    chunk = pd.read_csv(io.BytesIO(header + body), sep=sep, dtype=str, keep_default_na=False)
+    column = resolve_column(list(chunk.columns), column)
+    invalid = convert_chunk(chunk, column, category, from_unit, to_unit, output_column)
+    with open(part, "w", newline="", encoding="utf-8") as out:
+        chunk.to_csv(out, sep=sep, index=False, header=index == 0)
+    return len(chunk), invalid
+
+
+def convert_csv_sharded(src, dst, column, category, from_unit, to_unit, sep=None,
+                        workers=None, shard_bytes=DEFAULT_SHARD_BYTES, output_column=None):
+    """Convert ``src`` to ``dst`` across a pool of ``workers`` processes.
+
+    Returns ``(rows, invalid)`` like ``converter.streaming.convert_csv``.
+    """
+    check_distinct(src, dst)
+    sep = sep or infer_separator(src)
+    header, ranges = shard_boundaries(src, shard_bytes)
+    if not ranges:
+        # Header-only input: a single empty shard still writes the header
+        ranges = [(len(header), len(header))]
+
+    rows = invalid = 0
+    tmpdir = tempfile.mkdtemp(prefix=".convert-", dir=os.path.dirname(os.path.abspath(dst)))
+    try:
+        tasks = [
+            (src, start, end, header, index, os.path.join(tmpdir, f"{index:08d}.part"), sep,
+             column, category, from_unit, to_unit, output_column)
+            for index, (start, end) in enumerate(ranges)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool, open(dst, "wb") as out:
+            # map() yields in submission order, so parts are appended in file order
+            # as soon as each one (and every one before it) is done
+            for task, (shard_rows, shard_invalid) in zip(tasks, pool.map(_convert_shard, tasks)):
+                with open(task[5], "rb") as part:
+                    shutil.copyfileobj(part, out)
+                os.remove(task[5])
+                rows += shard_rows
+                invalid += shard_invalid
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+    return rows, invalid
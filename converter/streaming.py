@@ -0,0 +1,102 @@
+"""Chunked conversion or summary of one column of a CSV/TSV file.
+
+The file is read ``chunksize`` rows at a time so memory stays flat however
+large the input is. Every column other than the converted one is passed
+through as text, untouched.
+"""
+
+import os
+
+import pandas as pd
+
+from converter.aggregate import StreamingStats
+from converter.batch import convert_array
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def infer_separator(path):
+    """Return the field separator implied by a file's extension."""
+    return "\t" if os.path.splitext(path)[1].lower() in (".tsv", ".tab") else ","
+
+
+def resolve_column(columns, column):
+    """Resolve ``column`` given as a header name or a zero-based index."""
+    if column in columns:
+        return column
+    try:
+        return columns[int(column)]
+    except (ValueError, IndexError):
+        raise ValueError(f"Column {column!r} not found in {list(columns)}") from None
+
+
+def check_distinct(src, dst):
+    """Raise ValueError if ``dst`` is ``src``, which opening it would truncate."""
+    try:
+        same = os.path.samefile(src, dst)
+    except OSError:
+        # One of them does not exist yet
+        same = os.path.abspath(src) == os.path.abspath(dst)
+    if same:
+        raise ValueError(f"Output {dst!r} is the input file; text files cannot be converted in place")
+
+
+def parse_column(raw):
+    """Parse a text column to float64; return ``(values, invalid)``.
+
+    Empty cells become NaN silently; ``invalid`` counts the non-empty cells
+    that could not be parsed as numbers.
+    """
+    values = pd.to_numeric(raw, errors="coerce").to_numpy(dtype="float64")
+    return values, int((pd.isna(values) & (raw != "")).sum())
+
+
+def convert_chunk(chunk, column, category, from_unit, to_unit, output_column=None):
+    """Convert ``column`` of a text-typed DataFrame chunk in place.
+
+    Returns the number of non-empty cells that could not be parsed as numbers.
+    """
+    values, invalid = parse_column(chunk[column])
+    convert_array(category, values, from_unit, to_unit, out=values)
+    chunk[output_column or column] = values
+    return invalid
+
+
+def convert_csv(src, dst, column, category, from_unit, to_unit,
+                sep=None, chunksize=DEFAULT_CHUNKSIZE, output_column=None):
+    """Stream ``src`` to ``dst`` converting one column chunk by chunk.
+
+    Returns ``(rows, invalid)``: rows written and cells that failed to parse.
+    """
+    check_distinct(src, dst)
+    sep = sep or infer_separator(src)
+    rows = invalid = 0
+    reader = pd.read_csv(src, sep=sep, dtype=str, keep_default_na=False, chunksize=chunksize)
+    with reader, open(dst, "w", newline="", encoding="utf-8") as out:
+        for index, chunk in enumerate(reader):
+            if index == 0:
+                column = resolve_column(list(chunk.columns), column)
+            invalid += convert_chunk(chunk, column, category, from_unit, to_unit, output_column)
+            chunk.to_csv(out, sep=sep, index=False, header=index == 0)
+            rows += len(chunk)
+    return rows, invalid
+
+
+def summarize_csv(src, column, category, unit, sep=None, chunksize=DEFAULT_CHUNKSIZE, bins=None):
+    """Stream ``column`` of ``src`` into a :class:`StreamingStats` in ``unit``.
+
+    Nothing is converted or written; ask the result for any target unit.
+    Returns ``(stats, invalid)``, invalid counting cells that failed to parse.
+    """
+    stats = StreamingStats(category, unit, bins)
+    invalid = 0
+    reader = pd.read_csv(src, sep=sep or infer_separator(src), dtype=str,
+                         keep_default_na=False, chunksize=chunksize)
+    with reader:
+        for index, chunk in enumerate(reader):
+            if index == 0:
+                column = resolve_column(list(chunk.columns), column)
+            values, chunk_invalid = parse_column(chunk[column])
+            stats.update(values)
+            invalid += chunk_invalid
+    return stats, invalid
@@ -0,0 +1,202 @@
+"""Binary framed socket protocol for bulk numeric conversion.
+
+    python -m converter.wire --port 8001
+    python -m converter.wire --unix /tmp/converter.sock
+
+Every request is an 18-byte little-endian header followed by ``count``
+packed floats::
+
+    magic b"UCV1" | category ID u8 | from-unit ID u16 | to-unit ID u16 | dtype u8 | count u64
+
+IDs are ``converter.engine.CATEGORY_IDS`` and ``UNIT_IDS``; dtype is 0 for
+float64 and 1 for float32. The response header is::
+
+    magic b"UCV1" | status u8 | dtype u8 | count u64
+
+followed by ``count`` converted floats of the same dtype, or, when status
+is non-zero, ``count`` bytes of UTF-8 error message. The server receives
+payloads straight into a buffer it owns, converts them in place through
+``numpy.frombuffer`` and writes that same buffer back.
+"""
+
+import argparse
+import asyncio
+import socket
+import struct
+
+import numpy as np
+
+from converter.batch import FACTOR_MATRICES, OFFSET_MATRICES
+from converter.engine import CATEGORY_IDS, CATEGORY_ORDER, unit_id
+
+MAGIC = b"UCV1"
+REQUEST = struct.Struct("<4sBHHBQ")
+RESPONSE = struct.Struct("<4sBBQ")
+DTYPES = (np.dtype("<f8"), np.dtype("<f4"))
+DTYPE_CODES = {dtype: code for code, dtype in enumerate(DTYPES)}
+MAX_PAYLOAD_BYTES = 1 << 30
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def _affine(category_id, from_id, to_id):
+    try:
+        category = CATEGORY_ORDER[category_id]
+        return (float(FACTOR_MATRICES[category][from_id, to_id]),
+                float(OFFSET_MATRICES[category][from_id, to_id]))
+    except IndexError:
+        raise ProtocolError(f"Unknown category/unit IDs {category_id}/{from_id}/{to_id}") from None
+
+
+class FrameProtocol(asyncio.BufferedProtocol):
+    """Reads frames directly into owned buffers and converts them in place."""
+
+    def __init__(self):
+        self.header = bytearray(REQUEST.size)
+        self.buffer = self.header
+        self.filled = 0
+        self.frame = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def get_buffer(self, sizehint):
+        return memoryview(self.buffer)[self.filled:]
+
+    def buffer_updated(self, nbytes):
+        self.filled += nbytes
+        if self.filled < len(self.buffer):
+            return
+        if self.buffer is self.header:
+            self._start_payload()
+        else:
+            self._finish_payload()
+
+    def _start_payload(self):
+        magic, category_id, from_id, to_id, dtype_code, count = REQUEST.unpack(self.header)
+        if magic != MAGIC or dtype_code >= len(DTYPES):
+            # The stream cannot be resynchronised after a malformed header
+            self._send_error(0, "Malformed frame header")
+            self.transport.close()
+            return
+        dtype = DTYPES[dtype_code]
+        if count * dtype.itemsize > MAX_PAYLOAD_BYTES:
+            self._send_error(dtype_code, "Payload too large")
+            self.transport.close()
+            return
+        self.frame = (category_id, from_id, to_id, dtype)
+        self.buffer = bytearray(count * dtype.itemsize)
+        self.filled = 0
+        if not self.buffer:
+            self._finish_payload()
+
+    def _finish_payload(self):
+        category_id, from_id, to_id, dtype = self.frame
+        payload = self.buffer
+        self.buffer = self.header
+        self.filled = 0
+        try:
+            scale, offset = _affine(category_id, from_id, to_id)
+        except ProtocolError as exc:
+            self._send_error(DTYPE_CODES[dtype], str(exc))
+            return
+        values = np.frombuffer(payload, dtype=dtype)
+        np.multiply(values, scale, out=values)
+        if offset:
+            np.add(values, offset, out=values)
+        self.transport.write(RESPONSE.pack(MAGIC, STATUS_OK, DTYPE_CODES[dtype], values.size))
+        self.transport.write(payload)
+
+    def _send_error(self, dtype_code, message):
+        message = message.encode()
+        self.transport.write(RESPONSE.pack(MAGIC, STATUS_ERROR, dtype_code, len(message)) + message)
+
+
+async def serve(host="127.0.0.1", port=8001, unix_path=None):
+    loop = asyncio.get_running_loop()
+    if unix_path:
+        server = await loop.create_unix_server(FrameProtocol, unix_path)
+    else:
+        server = await loop.create_server(FrameProtocol, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+class ConversionClient:
+    """Blocking client for the framed protocol.
+
+    ``address`` is a ``(host, port)`` tuple or a Unix socket path.
+    """
+
+    def __init__(self, address):
+        if isinstance(address, str):
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.connect(address)
+
+    def close(self):
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _recv_into(self, view):
+        while view:
+            received = self.sock.recv_into(view)
+            if not received:
+                raise ConnectionError("Connection closed mid-frame")
+            view = view[received:]
+
+    def convert(self, category, values, from_unit, to_unit):
+        """Convert a float64 or float32 array and return a new array of that dtype and shape."""
+        values = np.ascontiguousarray(values)
+        if values.dtype not in DTYPE_CODES:
+            values = values.astype(DTYPES[0])
+        dtype_code = DTYPE_CODES[values.dtype]
+        header = REQUEST.pack(MAGIC, CATEGORY_IDS[category], unit_id(category, from_unit),
+                              unit_id(category, to_unit), dtype_code, values.size)
+        self.sock.sendall(header)
+        self.sock.sendall(memoryview(values).cast("B"))
+
+        response = bytearray(RESPONSE.size)
+        self._recv_into(memoryview(response))
+        magic, status, dtype_code, count = RESPONSE.unpack(response)
+        if magic != MAGIC:
+            raise ProtocolError("Malformed response header")
+        if status != STATUS_OK:
+            message = bytearray(count)
+            self._recv_into(memoryview(message))
+            raise ProtocolError(message.decode())
+        if count != values.size:
+            raise ProtocolError(f"Expected {values.size} values in the response, got {count}")
+        result = np.empty(values.shape, dtype=DTYPES[dtype_code])
+        self._recv_into(memoryview(result).cast("B"))
+        return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m converter.wire",
+                                     description="Serve the binary framed conversion protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead of TCP")
+    args = parser.parse_args(argv)
+    print(f"Serving framed conversions on {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
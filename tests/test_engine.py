@@ -0,0 +1,101 @@
+import math
+import pickle
+import warnings
+
+import numpy as np
+import pytest
+
+from converter.batch import convert_array, convert_ids, convert_pairs, convert_to_all
+from converter.dimensions import conversion_factor, convert_compound, parse_unit
+from converter.engine import (
+    CATEGORY_ORDER,
+    REGISTRY,
+    category_for,
+    conversion_plan,
+    conversion_units,
+    convert,
+    unit_id,
+)
+from converter.frames import convert_mixed
+from converter.registry import load_registry
+
+
+@pytest.mark.parametrize("category, value, from_unit, to_unit, expected", [
+    ("Length", 1, "Mile", "Kilometer", 1.609344),
+    ("Temperature", 100, "Celsius", "Fahrenheit", 212),
+    ("Temperature", 0, "Kelvin", "Celsius", -273.15),
+    ("Mass", 1, "Kilogram", "Gram", 1000),
+    ("Length", 1, "mi", "km", 1.609344),
+])
+def test_convert(category, value, from_unit, to_unit, expected):
+    assert convert(category, value, from_unit, to_unit) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("category", CATEGORY_ORDER)
+def test_every_pair_round_trips(category):
+    for from_unit in conversion_units[category]:
+        for to_unit in conversion_units[category]:
+            there = convert(category, 12.5, from_unit, to_unit)
+            assert convert(category, there, to_unit, from_unit) == pytest.approx(12.5)
+
+
+def test_unknown_units_raise_value_error():
+    with pytest.raises(ValueError):
+        conversion_plan("Length", "Mile", "Kilogram")
+    with pytest.raises(ValueError):
+        unit_id("Length", "parsec")
+    assert category_for("Mile", "Kilogram") is None
+
+
+def test_alias_resolution_does_not_depend_on_case():
+    for label in ("metric ton", "Metric ton", "Metric Ton"):
+        assert convert("Mass", 1, label, "kg") == 1000
+    assert unit_id("Bits & Bytes", "Mb") != unit_id("Bits & Bytes", "MB")
+
+
+def test_compiled_registry_matches_snapshot():
+    compiled = load_registry(use_snapshot=False)
+    assert compiled.names == REGISTRY.names
+    assert compiled.scales == REGISTRY.scales
+    assert compiled.exact_scales == REGISTRY.exact_scales
+    assert compiled.pair_scales == REGISTRY.pair_scales
+    restored = pickle.loads(pickle.dumps(compiled))
+    assert restored.aliases == compiled.aliases
+    assert restored.units("Length") == compiled.units("Length")
+
+
+def test_vectorized_paths_agree_with_scalar():
+    values = np.array([-40.0, 0.0, 36.6, 100.0])
+    expected = [convert("Temperature", v, "Celsius", "Fahrenheit") for v in values]
+    assert convert_array("Temperature", values, "Celsius", "Fahrenheit") == pytest.approx(expected)
+    to_id = unit_id("Temperature", "Fahrenheit")
+    assert convert_to_all("Temperature", values, "Celsius")[:, to_id] == pytest.approx(expected)
+    from_id = unit_id("Temperature", "Celsius")
+    assert convert_pairs("Temperature", values, from_id, to_id) == pytest.approx(expected)
+    assert convert_ids("Temperature", 100.0, from_id, to_id) == pytest.approx(212)
+
+
+def test_unit_ids_are_bounds_checked():
+    with pytest.raises(ValueError):
+        convert_ids("Length", 1.0, -1, 0)
+    with pytest.raises(ValueError):
+        convert_ids("Length", 1.0, 0, len(conversion_units["Length"]))
+    with pytest.raises(ValueError):
+        convert_pairs("Length", [1.0, 2.0], [0, -1], [1, 0])
+
+
+def test_compound_units_use_exact_scales():
+    assert convert_compound(1, "m/s", "km/h") == 3.6
+    assert parse_unit("km/h").scale == parse_unit("m/s").scale * 5 / 18
+    with pytest.raises(ValueError):
+        conversion_factor("m^2", "m")
+    with pytest.raises(ValueError):
+        conversion_factor("m^1000", "ft^1000")
+
+
+def test_convert_mixed_accepts_plain_lists():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = convert_mixed("Length", [1, 1, 1], ["Mile", "km", None], errors="coerce")
+    assert out[:2] == pytest.approx([1609.344, 1000])
+    assert math.isnan(out[2])
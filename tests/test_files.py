@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from converter.binary import convert_file
+from converter.cli import main
+from converter.sharded import convert_csv_sharded
+from converter.streaming import convert_csv
+
+
+@pytest.fixture
+def readings(tmp_path):
+    path = tmp_path / "readings.csv"
+    pd.DataFrame({"id": range(500), "distance": np.arange(500) * 0.5}).to_csv(path, index=False)
+    return path
+
+
+def test_convert_csv(readings, tmp_path):
+    out = tmp_path / "out.csv"
+    assert convert_csv(readings, out, "distance", "Length", "Mile", "Kilometer", chunksize=64) == (500, 0)
+    result = pd.read_csv(out)
+    assert list(result["id"]) == list(range(500))
+    assert result["distance"].to_numpy() == pytest.approx(np.arange(500) * 0.5 * 1.609344)
+
+
+def test_sharded_matches_streaming(readings, tmp_path):
+    convert_csv(readings, tmp_path / "streamed.csv", "distance", "Length", "Mile", "Kilometer")
+    rows = convert_csv_sharded(readings, tmp_path / "sharded.csv", "distance", "Length", "Mile",
+                               "Kilometer", workers=2, shard_bytes=1024)
+    assert rows == (500, 0)
+    assert (tmp_path / "sharded.csv").read_bytes() == (tmp_path / "streamed.csv").read_bytes()
+
+
+@pytest.mark.parametrize("convert", [convert_csv, convert_csv_sharded])
+def test_text_conversion_refuses_in_place(readings, convert):
+    before = readings.read_bytes()
+    with pytest.raises(ValueError):
+        convert(readings, readings, "distance", "Length", "Mile", "Kilometer")
+    assert readings.read_bytes() == before
+
+
+def test_binary_in_place(tmp_path):
+    path = tmp_path / "k.npy"
+    np.save(path, np.array([0.0, 273.15, 373.15]))
+    assert convert_file(path, path, "Temperature", "Kelvin", "Celsius") == 3
+    assert np.load(path) == pytest.approx([-273.15, 0, 100])
+
+
+def test_float32_output_of_affine_conversion(tmp_path):
+    kelvin = 273.15 + np.random.default_rng(0).uniform(-0.01, 0.01, 1000)
+    np.save(tmp_path / "k.npy", kelvin)
+    convert_file(tmp_path / "k.npy", tmp_path / "c.npy", "Temperature", "Kelvin", "Celsius",
+                 dtype="float32", on_loss="raise", block=100)
+    result = np.load(tmp_path / "c.npy")
+    assert result.dtype == np.float32
+    exact = kelvin - 273.15
+    assert np.max(np.abs(result - exact) / np.abs(exact)) < 1e-6
+
+
+def test_cli_reports_missing_input(tmp_path, capsys):
+    for name in ("missing.csv", "missing.npy"):
+        argv = [str(tmp_path / name), str(tmp_path / "out"), "--column", "v", "--from", "m", "--to", "ft"]
+        assert main(argv) == 2
+        assert "error:" in capsys.readouterr().err
+
+
+def test_cli_converts_csv(readings, tmp_path):
+    out = tmp_path / "out.csv"
+    assert main([str(readings), str(out), "--column", "distance", "--from", "mi", "--to", "km"]) == 0
+    assert pd.read_csv(out)["distance"].iloc[2] == pytest.approx(1.609344)
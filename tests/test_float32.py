@@ -0,0 +1,47 @@
+import math
+from unittest import mock
+
+import numpy as np
+import pytest
+
+from converter import batch
+from converter.batch import PrecisionError, PrecisionWarning, check_float32, convert_array32, float32_error
+
+
+def test_linear_conversion_passes():
+    values = np.linspace(1, 1e6, 10_000)
+    result, error = convert_array32("Length", values, "Mile", "Kilometer")
+    assert result.dtype == np.float32
+    assert error < batch.FLOAT32_TOLERANCE
+    assert result == pytest.approx(values * 1.609344, rel=1e-6)
+
+
+def test_affine_cancellation_is_caught():
+    kelvin = (273.15 + np.linspace(-0.01, 0.01, 1000)).astype(np.float32)
+    with pytest.raises(PrecisionError):
+        check_float32("Temperature", kelvin, "Kelvin", "Celsius", on_loss="raise")
+    with pytest.warns(PrecisionWarning):
+        check_float32("Temperature", kelvin, "Kelvin", "Celsius")
+
+
+def test_rounding_on_store_only():
+    kelvin = 273.15 + np.linspace(-0.01, 0.01, 1000)
+    assert float32_error("Temperature", kelvin, "Kelvin", "Celsius", compute32=False) < 1e-7
+
+
+def test_ignore_skips_the_check():
+    with mock.patch.object(batch, "float32_error") as measure:
+        assert math.isnan(check_float32("Temperature", [273.15], "Kelvin", "Celsius", on_loss="ignore"))
+    measure.assert_not_called()
+    with pytest.raises(ValueError):
+        check_float32("Length", [1.0], "m", "km", on_loss="sometimes")
+
+
+def test_convert_array32_out():
+    values = np.arange(4, dtype=np.float32)
+    result, _ = convert_array32("Length", values, "Meter", "Kilometer")
+    assert result is not values and values[1] == 1
+    result, _ = convert_array32("Length", values, "Meter", "Kilometer", out=values)
+    assert result is values and values[1] == np.float32(0.001)
+    with pytest.raises(ValueError):
+        convert_array32("Length", np.arange(4.0), "Meter", "Kilometer", out=np.empty(4))
@@ -0,0 +1,65 @@
+import asyncio
+import json
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+
+from converter.service import ConversionServer, RequestError, dispatch
+
+
+def post(path, payload):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    status, response = dispatch("POST", path, body)
+    return status, json.loads(response)
+
+
+def test_convert():
+    status, result = post("/convert", {"value": 1, "from": "mi", "to": "km"})
+    assert status == HTTPStatus.OK
+    assert result == {"category": "Length", "value": pytest.approx(1.609344)}
+
+
+def test_batch_forms():
+    _, result = post("/convert/batch", {"values": [1, 2], "from": "Kilometer", "to": "Meter"})
+    assert result["values"] == [1000, 2000]
+    _, result = post("/convert/batch", {"items": [[1, "mi", "km"], [32, "F", "C"]]})
+    assert result["values"] == pytest.approx([1.609344, 0])
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/convert", {"value": 1, "from": "mi", "to": "kg"}),
+    ("/convert", {"from": "mi", "to": "km"}),
+    ("/convert", {"value": 1e308, "from": "km", "to": "mm"}),
+    ("/convert", b'{"value": ' + b"9" * 400 + b', "from": "km", "to": "m"}'),
+    ("/convert", b"[1, 2]"),
+    ("/convert/batch", {"items": [[1, "mi", "parsec"]]}),
+    ("/convert/batch", {"values": [1, 1e308], "from": "km", "to": "mm"}),
+])
+@pytest.mark.filterwarnings("ignore:overflow encountered:RuntimeWarning")
+def test_bad_requests(path, body):
+    with pytest.raises(RequestError) as error:
+        post(path, body)
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_routing_errors():
+    with pytest.raises(RequestError) as error:
+        dispatch("POST", "/nowhere", b"{}")
+    assert error.value.status == HTTPStatus.NOT_FOUND
+    with pytest.raises(RequestError) as error:
+        dispatch("GET", "/convert", b"")
+    assert error.value.status == HTTPStatus.METHOD_NOT_ALLOWED
+
+
+def test_respond_maps_errors_to_statuses():
+    async def run():
+        server = ConversionServer(coalesce_window=0.001)
+        huge = b'{"value": ' + b"9" * 400 + b', "from": "km", "to": "m"}'
+        assert (await server.respond("POST", "/convert", huge))[0] == HTTPStatus.BAD_REQUEST
+        status, body = await server.respond("POST", "/convert", b'{"value": 2, "from": "km", "to": "m"}')
+        assert json.loads(body)["value"] == 2000
+        with mock.patch("converter.service.dispatch", side_effect=RuntimeError("bug")):
+            assert (await server.respond("GET", "/health", b""))[0] == HTTPStatus.INTERNAL_SERVER_ERROR
+
+    asyncio.run(run())